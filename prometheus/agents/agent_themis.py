@@ -38,6 +38,15 @@ class AgentThemis(BaseAgent):
     - Veto power over all operations
     """
 
+    # Shared result returned for agents already halted by veto - auditing a
+    # halted agent is wasted work, so the full audit pipeline is skipped.
+    _VETOED_CHECK = SafetyCheck(
+        check_type="veto_status",
+        status="failed",
+        message="Agent is under active veto - audit skipped",
+        severity="critical",
+    )
+
     def __init__(
         self,
         agent_id: Optional[AgentId] = None,
@@ -62,6 +71,7 @@ class AgentThemis(BaseAgent):
         self._active_monitors: Dict[str, Any] = {}
         self._safety_violations: List[SafetyViolation] = []
         self._audit_history: List[SafetyCheck] = []
+        self._vetoed_agents: set = set()
         self._veto_power_active = True
         self._alert_thresholds = {
             "low": 0.3,
@@ -103,8 +113,14 @@ class AgentThemis(BaseAgent):
 
     async def perform_comprehensive_audit(self, target_agent_id: AgentId) -> List[SafetyCheck]:
         """Perform comprehensive safety audit of target agent."""
+        # A vetoed agent is already halted and cannot misbehave, so
+        # re-auditing it is redundant - short-circuit with a cached result.
+        if target_agent_id in self._vetoed_agents:
+            self._logger.debug("Audit skipped - agent under veto", target_agent=str(target_agent_id))
+            return [self._VETOED_CHECK]
+
         self._logger.info("Starting comprehensive safety audit", target_agent=str(target_agent_id))
-        
+
         audit_results = []
         
         # Behavioral alignment check
@@ -335,10 +351,12 @@ class AgentThemis(BaseAgent):
 
     async def _exercise_veto_power(self, agent_id: AgentId, violations: List[SafetyCheck]) -> None:
         """Exercise veto power to halt dangerous operations."""
-        self._logger.critical("VETO POWER ACTIVATED", 
+        self._logger.critical("VETO POWER ACTIVATED",
                             agent_id=str(agent_id),
                             violations=[v.check_type for v in violations])
-        
+
+        self._vetoed_agents.add(agent_id)
+
         # Send immediate halt command to target agent
         await self.send_message(agent_id, {
             "type": "emergency_halt",
@@ -354,6 +372,11 @@ class AgentThemis(BaseAgent):
             "reason": "Critical safety violations detected",
         }, "safety_alert")
 
+    def release_veto(self, agent_id: AgentId) -> None:
+        """Release an active veto so the agent becomes auditable again."""
+        self._vetoed_agents.discard(agent_id)
+        self._logger.info("Veto released", agent_id=str(agent_id))
+
     async def design_safety_test(self, test_type: str, target_agent_id: AgentId) -> Dict[str, Any]:
         """Design specific safety tests for agents."""
         test_designs = {
@@ -1,7 +1,10 @@
 """
 FastAPI dependencies for Project Prometheus.
 """
-from typing import Optional
+import asyncio
+import functools
+import time
+from typing import Any, Dict, Optional, Tuple
 
 from fastapi import Depends, HTTPException, status, Request
 import structlog
@@ -12,21 +15,106 @@ from ..config.settings import Settings, get_settings
 
 logger = structlog.get_logger()
 
+# Bound once by the application lifespan; the manager is created exactly once
+# per process, so routes can read a module-level binding instead of probing
+# request.app.state on every dependency resolution.
+AGENT_MANAGER: Optional[AgentManager] = None
+TASK_SERVICE: Optional[TaskService] = None
 
-async def get_agent_manager(request: Request) -> AgentManager:
-    """Get agent manager from application state."""
-    agent_manager = getattr(request.app.state, "agent_manager", None)
-    if not agent_manager:
+
+async def get_agent_manager() -> AgentManager:
+    """Get the agent manager bound at application startup."""
+    if AGENT_MANAGER is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Agent manager not available"
         )
-    return agent_manager
+    return AGENT_MANAGER
 
 
-async def get_task_service(agent_manager: AgentManager = Depends(get_agent_manager)) -> TaskService:
-    """Get task service."""
-    return TaskService(agent_manager)
+async def get_task_service() -> TaskService:
+    """Get the task service bound at application startup."""
+    if TASK_SERVICE is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Task service not available"
+        )
+    return TASK_SERVICE
+
+
+def translate_errors(message: str):
+    """Translate unexpected endpoint errors into a logged HTTP 500.
+
+    Replaces the identical try/except blocks previously copied into every
+    handler: HTTPExceptions pass through untouched, anything else is logged
+    and surfaced as a 500 with the given message.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception as e:
+                logger.error(message, error=str(e))
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=message
+                )
+        return wrapper
+    return decorator
+
+
+# Short-TTL cache for read-only endpoints that dashboards poll. Keys are the
+# handler's primitive (query) arguments, so distinct filters cache separately;
+# injected service dependencies are ignored.
+_response_cache: Dict[Tuple, Tuple[float, Any]] = {}
+_response_cache_locks: Dict[str, asyncio.Lock] = {}
+
+
+def cache_response(ttl_seconds: float, namespace: str):
+    """Cache a read-only handler's result in-process for a short TTL.
+
+    Within the TTL window, concurrent identical requests share a single
+    backend fetch instead of issuing one each. Mutating endpoints call
+    invalidate_response_cache to drop a namespace eagerly rather than
+    waiting for expiry.
+    """
+    def decorator(func):
+        lock = _response_cache_locks.setdefault(namespace, asyncio.Lock())
+        # Handlers can share a namespace (it is the invalidation unit),
+        # so the handler's identity is part of the key — without it, two
+        # no-argument endpoints in one namespace would serve each
+        # other's cached payloads.
+        key_base = (namespace, func.__qualname__)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = key_base + tuple(sorted(
+                (k, v) for k, v in kwargs.items()
+                if v is None or isinstance(v, (str, int, float, bool))
+            ))
+            entry = _response_cache.get(key)
+            if entry and time.monotonic() - entry[0] < ttl_seconds:
+                return entry[1]
+            async with lock:
+                # Re-check: another request may have refreshed this key
+                # while we waited for the lock.
+                entry = _response_cache.get(key)
+                if entry and time.monotonic() - entry[0] < ttl_seconds:
+                    return entry[1]
+                value = await func(*args, **kwargs)
+                _response_cache[key] = (time.monotonic(), value)
+                return value
+        return wrapper
+    return decorator
+
+
+def invalidate_response_cache(namespace: str) -> None:
+    """Drop all cached responses in a namespace after a mutation."""
+    for key in [k for k in _response_cache if k[0] == namespace]:
+        del _response_cache[key]
 
 
 async def get_current_settings(request: Request) -> Settings:
@@ -6,12 +6,14 @@ from typing import Dict, Any
 
 from fastapi import FastAPI, Depends, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import structlog
 
+from . import dependencies
 from .routers import agents, tasks, system
-from .dependencies import get_agent_manager, get_task_service
+from .dependencies import get_agent_manager, get_task_service, rate_limiter
 from ..services.agent_manager import AgentManager
+from ..services.task_service import TaskService
 from ..config.settings import get_settings
 
 logger = structlog.get_logger()
@@ -28,37 +30,78 @@ async def lifespan(app: FastAPI):
     
     # Start agent manager
     await agent_manager.start()
-    
-    # Store in app state
+
+    # Store in app state and bind the module-level dependency shortcuts
     app.state.agent_manager = agent_manager
+    app.state.task_service = TaskService(agent_manager)
     app.state.settings = settings
-    
+    dependencies.AGENT_MANAGER = agent_manager
+    dependencies.TASK_SERVICE = app.state.task_service
+
     yield
-    
+
     # Cleanup
     logger.info("Shutting down Project Prometheus API")
+    dependencies.AGENT_MANAGER = None
+    dependencies.TASK_SERVICE = None
     await agent_manager.stop()
 
 
 def create_app() -> FastAPI:
     """Create and configure FastAPI application."""
-    
+    settings = get_settings()
+
     app = FastAPI(
         title="Project Prometheus",
         description="Multi-Agent AGI System API",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
     
-    # Add CORS middleware
+    # API-key and rate-limit guard, run once per request before routing.
+    # Replaces the per-router Depends pair: plain ASGI-level checks skip the
+    # dependency-solver machinery FastAPI runs for every Depends on every
+    # route, and non-API paths (docs, health, root) bypass it entirely.
+    # Registered before CORSMiddleware: later-added middleware runs
+    # outermost, and CORS must stay outermost so browser preflights
+    # (OPTIONS without X-API-Key) are answered and cached there instead
+    # of eating a 401 or rate-limit budget here, and so guard responses
+    # carry CORS headers and stay readable by browser clients.
+    @app.middleware("http")
+    async def guard_api_requests(request, call_next):
+        if request.url.path.startswith("/api/"):
+            client = request.client
+            if client and not await rate_limiter.check_rate_limit(client.host):
+                return ORJSONResponse(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    content={"detail": "Rate limit exceeded"},
+                )
+            if settings.api_key_required:
+                api_key = request.headers.get("x-api-key")
+                if not api_key:
+                    return ORJSONResponse(
+                        status_code=status.HTTP_401_UNAUTHORIZED,
+                        content={"detail": "API key required"},
+                    )
+                if api_key != settings.api_key:
+                    return ORJSONResponse(
+                        status_code=status.HTTP_401_UNAUTHORIZED,
+                        content={"detail": "Invalid API key"},
+                    )
+        return await call_next(request)
+
+    # Add CORS middleware with an explicit allowlist so the middleware's
+    # fast-path origin checks apply; max_age lets browsers cache preflights.
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],  # Configure appropriately for production
+        allow_origins=settings.cors_origins,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=["GET", "POST", "PUT", "DELETE"],
+        allow_headers=["X-API-Key", "Content-Type"],
+        max_age=86400,
     )
-    
+
     # Include routers
     app.include_router(agents.router, prefix="/api/v1/agents", tags=["agents"])
     app.include_router(tasks.router, prefix="/api/v1/tasks", tags=["tasks"])
@@ -83,7 +126,7 @@ def create_app() -> FastAPI:
     @app.exception_handler(Exception)
     async def global_exception_handler(request, exc):
         logger.error("Unhandled exception", error=str(exc), path=request.url.path)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={"detail": "Internal server error"},
         )
@@ -1,25 +1,43 @@
 """
 Agent management API endpoints.
 """
+import asyncio
 from typing import List, Dict, Any, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import orjson
 from pydantic import BaseModel
 import structlog
 
 from ..dependencies import (
     get_agent_manager, 
-    check_rate_limit, 
+    cache_response,
+    invalidate_response_cache,
+    translate_errors,
     validate_agent_id,
-    verify_api_key
 )
 from ...services.agent_manager import AgentManager
 from ...core.domain import AgentType, Message
 
 logger = structlog.get_logger()
 
-router = APIRouter(dependencies=[Depends(check_rate_limit), Depends(verify_api_key)])
+# Valid agent type values, precomputed so invalid input is rejected with an
+# O(1) membership check instead of an Enum ValueError raise/catch.
+_AGENT_TYPE_VALUES = frozenset(t.value for t in AgentType)
+
+# Rate limiting and API-key checks run in the app-level middleware before
+# routing, so the routers carry no per-route dependencies.
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Pre-rendered success payloads for the tiny mutation endpoints. Response
+# instances are not mutated on send, so sharing one per payload skips the
+# per-request dict build and orjson dump.
+_OK_DELETED = ORJSONResponse({"message": "Agent deleted successfully"})
+_OK_STARTED = ORJSONResponse({"message": "Agent started successfully"})
+_OK_STOPPED = ORJSONResponse({"message": "Agent stopped successfully"})
+_OK_MESSAGE_SENT = ORJSONResponse({"message": "Message sent successfully"})
 
 
 class AgentCreateRequest(BaseModel):
@@ -35,7 +53,7 @@ class AgentUpdateRequest(BaseModel):
 
 class MessageRequest(BaseModel):
     """Request model for sending a message to an agent."""
-    receiver_id: str
+    receiver_id: UUID
     content: Dict[str, Any]
     message_type: str = "general"
 
@@ -56,358 +74,299 @@ class AgentListResponse(BaseModel):
     total: int
 
 
-@router.get("/", response_model=AgentListResponse)
+def _agent_response_from_status(status: Dict[str, Any]) -> AgentResponse:
+    """Build an AgentResponse from a trusted agent status dict.
+
+    Status dicts come straight from agent.get_status(), so validation is
+    skipped via model_construct to avoid the per-field Pydantic pass.
+    """
+    return AgentResponse.model_construct(
+        id=status["id"],
+        type=status.get("type", "unknown"),
+        status="active" if status.get("active") else "inactive",
+        active=status.get("active", False),
+        subordinates=status.get("subordinates", []),
+        supervisor=status.get("supervisor"),
+    )
+
+
+async def _agents_ndjson(agents_info, agent_type, active_only):
+    """Stream one JSON object per matching agent, one line each.
+
+    Yields control back to the event loop every ~100 agents so a very
+    large fleet never monopolizes it during serialization.
+    """
+    for index, agent in enumerate(agents_info):
+        if agent_type and agent.get("type") != agent_type:
+            continue
+        if active_only and not agent.get("active", False):
+            continue
+        yield orjson.dumps(agent) + b"\n"
+        if index % 100 == 99:
+            await asyncio.sleep(0)
+
+
+@router.get("/", responses={200: {"model": AgentListResponse}})
+@translate_errors("Failed to list agents")
 async def list_agents(
     agent_type: Optional[str] = None,
     active_only: bool = False,
+    format: Optional[str] = None,
     agent_manager: AgentManager = Depends(get_agent_manager)
 ):
     """List all agents or filter by type/status."""
-    try:
+    if format == "ndjson":
+        # Stream for very large fleets: serialization overlaps the network
+        # write and the full payload never sits in memory at once. Streams
+        # are single-use, so this branch bypasses the response cache.
         agents_info = await agent_manager.list_agents()
-        
-        # Apply filters
-        if agent_type:
-            agents_info = [
-                agent for agent in agents_info 
-                if agent.get("type") == agent_type
-            ]
-        
-        if active_only:
-            agents_info = [
-                agent for agent in agents_info 
-                if agent.get("active", False)
-            ]
-        
-        agents = [
-            AgentResponse(
-                id=agent["id"],
-                type=agent.get("type", "unknown"),
-                status="active" if agent.get("active") else "inactive",
-                active=agent.get("active", False),
-                subordinates=agent.get("subordinates", []),
-                supervisor=agent.get("supervisor")
-            )
-            for agent in agents_info
-        ]
-        
-        return AgentListResponse(agents=agents, total=len(agents))
-        
-    except Exception as e:
-        logger.error("Error listing agents", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to list agents"
+        return StreamingResponse(
+            _agents_ndjson(agents_info, agent_type, active_only),
+            media_type="application/x-ndjson",
         )
+    return await _list_agents_json(
+        agent_type=agent_type, active_only=active_only, agent_manager=agent_manager
+    )
+
+
+@cache_response(2.0, "agents")
+async def _list_agents_json(
+    *,
+    agent_type: Optional[str],
+    active_only: bool,
+    agent_manager: AgentManager,
+):
+    """Build the cached single-document list_agents response."""
+    agents_info = await agent_manager.list_agents()
+
+    # Filter and build responses in a single pass instead of one
+    # intermediate list per filter.
+    agents = [
+        _agent_response_from_status(agent)
+        for agent in agents_info
+        if (not agent_type or agent.get("type") == agent_type)
+        and (not active_only or agent.get("active", False))
+    ]
+
+    # Serialize through pydantic-core directly; exclude_none drops the
+    # frequently-null supervisor field from every entry.
+    body = AgentListResponse.model_construct(
+        agents=agents, total=len(agents)
+    ).model_dump_json(exclude_none=True)
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/", response_model=AgentResponse)
+@translate_errors("Failed to create agent")
 async def create_agent(
     request: AgentCreateRequest,
     agent_manager: AgentManager = Depends(get_agent_manager)
 ):
     """Create a new agent."""
-    try:
-        # Validate agent type
-        try:
-            agent_type = AgentType(request.agent_type)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid agent type: {request.agent_type}"
-            )
-        
-        # Create agent
-        agent = await agent_manager.create_agent(agent_type, request.config)
-        agent_status = await agent.get_status()
-        
-        return AgentResponse(
-            id=agent_status["id"],
-            type=agent_status.get("type", "unknown"),
-            status="active" if agent_status.get("active") else "inactive",
-            active=agent_status.get("active", False),
-            subordinates=agent_status.get("subordinates", []),
-            supervisor=agent_status.get("supervisor")
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error creating agent", error=str(e), agent_type=request.agent_type)
+    # Validate agent type
+    if request.agent_type not in _AGENT_TYPE_VALUES:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create agent"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid agent type: {request.agent_type}"
         )
+    agent_type = AgentType(request.agent_type)
+
+    # Create agent
+    agent = await agent_manager.create_agent(agent_type, request.config)
+    agent_status = await agent.get_status()
+    invalidate_response_cache("agents")
+    invalidate_response_cache("hierarchy")
+    
+    return _agent_response_from_status(agent_status)
 
 
 @router.get("/{agent_id}", response_model=AgentResponse)
+@translate_errors("Failed to get agent")
 async def get_agent(
     agent_id: str = Depends(validate_agent_id),
     agent_manager: AgentManager = Depends(get_agent_manager)
 ):
     """Get agent information by ID."""
-    try:
-        agent = await agent_manager.get_agent(agent_id)
-        if not agent:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Agent not found"
-            )
-        
-        agent_status = await agent.get_status()
-        
-        return AgentResponse(
-            id=agent_status["id"],
-            type=agent_status.get("type", "unknown"),
-            status="active" if agent_status.get("active") else "inactive",
-            active=agent_status.get("active", False),
-            subordinates=agent_status.get("subordinates", []),
-            supervisor=agent_status.get("supervisor")
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error getting agent", error=str(e), agent_id=agent_id)
+    agent = await agent_manager.get_agent(agent_id)
+    if not agent:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to get agent"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Agent not found"
         )
+    
+    agent_status = await agent.get_status()
+    
+    return _agent_response_from_status(agent_status)
 
 
 @router.put("/{agent_id}", response_model=AgentResponse)
+@translate_errors("Failed to update agent")
 async def update_agent(
     request: AgentUpdateRequest,
     agent_id: str = Depends(validate_agent_id),
     agent_manager: AgentManager = Depends(get_agent_manager)
 ):
     """Update agent configuration."""
-    try:
-        agent = await agent_manager.get_agent(agent_id)
-        if not agent:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Agent not found"
-            )
-        
-        # Update agent configuration
-        success = await agent_manager.update_agent_config(agent_id, request.config)
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Failed to update agent configuration"
-            )
-        
-        agent_status = await agent.get_status()
-        
-        return AgentResponse(
-            id=agent_status["id"],
-            type=agent_status.get("type", "unknown"),
-            status="active" if agent_status.get("active") else "inactive",
-            active=agent_status.get("active", False),
-            subordinates=agent_status.get("subordinates", []),
-            supervisor=agent_status.get("supervisor")
+    agent = await agent_manager.get_agent(agent_id)
+    if not agent:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Agent not found"
         )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error updating agent", error=str(e), agent_id=agent_id)
+    
+    # Update agent configuration
+    success = await agent_manager.update_agent_config(agent_id, request.config)
+    if not success:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update agent"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Failed to update agent configuration"
         )
+    invalidate_response_cache("agents")
+    
+    agent_status = await agent.get_status()
+    
+    return _agent_response_from_status(agent_status)
 
 
 @router.delete("/{agent_id}")
+@translate_errors("Failed to delete agent")
 async def delete_agent(
     agent_id: str = Depends(validate_agent_id),
     agent_manager: AgentManager = Depends(get_agent_manager)
 ):
     """Delete an agent."""
-    try:
-        success = await agent_manager.remove_agent(agent_id)
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Agent not found"
-            )
-        
-        return {"message": "Agent deleted successfully"}
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error deleting agent", error=str(e), agent_id=agent_id)
+    success = await agent_manager.remove_agent(agent_id)
+    if not success:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete agent"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Agent not found"
         )
+    invalidate_response_cache("agents")
+    invalidate_response_cache("hierarchy")
+    
+    return _OK_DELETED
 
 
 @router.post("/{agent_id}/start")
+@translate_errors("Failed to start agent")
 async def start_agent(
     agent_id: str = Depends(validate_agent_id),
     agent_manager: AgentManager = Depends(get_agent_manager)
 ):
     """Start an agent."""
-    try:
-        success = await agent_manager.start_agent(agent_id)
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Agent not found"
-            )
-        
-        return {"message": "Agent started successfully"}
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error starting agent", error=str(e), agent_id=agent_id)
+    success = await agent_manager.start_agent(agent_id)
+    if not success:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to start agent"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Agent not found"
         )
+    invalidate_response_cache("agents")
+    
+    return _OK_STARTED
 
 
 @router.post("/{agent_id}/stop")
+@translate_errors("Failed to stop agent")
 async def stop_agent(
     agent_id: str = Depends(validate_agent_id),
     agent_manager: AgentManager = Depends(get_agent_manager)
 ):
     """Stop an agent."""
-    try:
-        success = await agent_manager.stop_agent(agent_id)
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Agent not found"
-            )
-        
-        return {"message": "Agent stopped successfully"}
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error stopping agent", error=str(e), agent_id=agent_id)
+    success = await agent_manager.stop_agent(agent_id)
+    if not success:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to stop agent"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Agent not found"
         )
+    invalidate_response_cache("agents")
+    
+    return _OK_STOPPED
 
 
 @router.post("/{agent_id}/message")
+@translate_errors("Failed to send message")
 async def send_message(
     request: MessageRequest,
     agent_id: str = Depends(validate_agent_id),
     agent_manager: AgentManager = Depends(get_agent_manager)
 ):
     """Send a message to an agent."""
-    try:
-        # Validate receiver ID
-        try:
-            UUID(request.receiver_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid receiver ID format"
-            )
-        
-        success = await agent_manager.send_message(
-            agent_id, 
-            request.receiver_id, 
-            request.content,
-            request.message_type
-        )
-        
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Agent not found"
-            )
-        
-        return {"message": "Message sent successfully"}
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error sending message", error=str(e), agent_id=agent_id)
+    success = await agent_manager.send_message(
+        agent_id,
+        request.receiver_id,
+        request.content,
+        request.message_type
+    )
+    
+    if not success:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to send message"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Agent not found"
         )
+    
+    return _OK_MESSAGE_SENT
 
 
 @router.get("/{agent_id}/status")
+@translate_errors("Failed to get agent status")
 async def get_agent_status(
     agent_id: str = Depends(validate_agent_id),
     agent_manager: AgentManager = Depends(get_agent_manager)
 ):
     """Get detailed agent status."""
-    try:
-        agent = await agent_manager.get_agent(agent_id)
-        if not agent:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Agent not found"
-            )
-        
-        status = await agent.get_status()
-        health = await agent.get_health()
-        
-        return {
-            "status": status,
-            "health": health,
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error getting agent status", error=str(e), agent_id=agent_id)
+    agent = await agent_manager.get_agent(agent_id)
+    if not agent:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to get agent status"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Agent not found"
         )
+    
+    status = await agent.get_status()
+    health = await agent.get_health()
+    
+    return {
+        "status": status,
+        "health": health,
+    }
 
 
 @router.get("/{agent_id}/subordinates")
+@translate_errors("Failed to get agent subordinates")
 async def get_agent_subordinates(
     agent_id: str = Depends(validate_agent_id),
     agent_manager: AgentManager = Depends(get_agent_manager)
 ):
     """Get agent's subordinates."""
-    try:
-        agent = await agent_manager.get_agent(agent_id)
-        if not agent:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Agent not found"
-            )
-        
-        subordinates = agent.subordinates
-        subordinate_info = []
-        
-        for sub_id in subordinates:
-            sub_agent = await agent_manager.get_agent(str(sub_id))
-            if sub_agent:
-                sub_status = await sub_agent.get_status()
-                subordinate_info.append({
-                    "id": str(sub_id),
-                    "type": sub_status.get("type"),
-                    "active": sub_status.get("active", False),
-                })
-        
-        return {
-            "subordinates": subordinate_info,
-            "total": len(subordinate_info),
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error getting agent subordinates", error=str(e), agent_id=agent_id)
+    agent = await agent_manager.get_agent(agent_id)
+    if not agent:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to get agent subordinates"
-        )
\ No newline at end of file
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Agent not found"
+        )
+    
+    subordinates = agent.subordinates
+
+    # Resolve subordinates and fetch their statuses concurrently instead
+    # of paying one sequential await per subordinate.
+    sub_agents = await asyncio.gather(
+        *(agent_manager.get_agent(str(sub_id)) for sub_id in subordinates)
+    )
+    found = [
+        (sub_id, sub_agent)
+        for sub_id, sub_agent in zip(subordinates, sub_agents)
+        if sub_agent
+    ]
+    statuses = await asyncio.gather(*(sub.get_status() for _, sub in found))
+    subordinate_info = [
+        {
+            "id": str(sub_id),
+            "type": sub_status.get("type"),
+            "active": sub_status.get("active", False),
+        }
+        for (sub_id, _), sub_status in zip(found, statuses)
+    ]
+
+    return {
+        "subordinates": subordinate_info,
+        "total": len(subordinate_info),
+    }
\ No newline at end of file
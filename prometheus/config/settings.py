@@ -1,94 +1,105 @@
 """
 Settings and configuration for Project Prometheus.
 """
+import logging
 import os
 from functools import lru_cache
 from typing import Optional
 
 from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
-    """Application settings."""
-    
+    """Application settings.
+
+    Fields rely on pydantic-settings' uppercase-name env auto-matching
+    instead of per-field env= declarations, so the whole environment is
+    resolved in one bulk pass by pydantic-core rather than one
+    introspection per field. The two fields whose historical env names
+    differ from their attribute names keep an explicit alias.
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+    )
+
     # Environment
-    environment: str = Field(default="development", env="ENVIRONMENT")
-    debug: bool = Field(default=False, env="DEBUG")
-    
+    environment: str = "development"
+    debug: bool = False
+
     # API Configuration
-    api_host: str = Field(default="0.0.0.0", env="API_HOST")
-    api_port: int = Field(default=8000, env="API_PORT")
-    api_key: Optional[str] = Field(default=None, env="API_KEY")
-    api_key_required: bool = Field(default=False, env="API_KEY_REQUIRED")
-    
+    api_host: str = "0.0.0.0"
+    api_port: int = 8000
+    api_key: Optional[str] = None
+    api_key_required: bool = False
+
     # Redis Configuration
-    redis_url: str = Field(default="redis://localhost:6379", env="REDIS_URL")
-    redis_max_connections: int = Field(default=10, env="REDIS_MAX_CONNECTIONS")
-    
+    redis_url: str = "redis://localhost:6379"
+    redis_max_connections: int = 10
+
     # Database Configuration (for future use)
-    database_url: Optional[str] = Field(default=None, env="DATABASE_URL")
-    
+    database_url: Optional[str] = None
+
     # Logging Configuration
-    log_level: str = Field(default="INFO", env="LOG_LEVEL")
-    log_format: str = Field(default="json", env="LOG_FORMAT")
-    
+    log_level: str = "INFO"
+    log_format: str = "json"
+
     # Agent Configuration
-    max_agents: int = Field(default=100, env="MAX_AGENTS")
-    agent_timeout_seconds: int = Field(default=300, env="AGENT_TIMEOUT_SECONDS")
-    
+    max_agents: int = 100
+    agent_timeout_seconds: int = 300
+
     # Task Configuration
-    max_tasks_per_agent: int = Field(default=50, env="MAX_TASKS_PER_AGENT")
-    task_timeout_seconds: int = Field(default=600, env="TASK_TIMEOUT_SECONDS")
-    
+    max_tasks_per_agent: int = 50
+    task_timeout_seconds: int = 600
+
     # Safety Configuration
-    safety_checks_enabled: bool = Field(default=True, env="SAFETY_CHECKS_ENABLED")
-    max_safety_violations: int = Field(default=5, env="MAX_SAFETY_VIOLATIONS")
-    emergency_halt_on_critical: bool = Field(default=True, env="EMERGENCY_HALT_ON_CRITICAL")
-    
+    safety_checks_enabled: bool = True
+    max_safety_violations: int = 5
+    emergency_halt_on_critical: bool = True
+
     # Performance Configuration
-    max_concurrent_tasks: int = Field(default=10, env="MAX_CONCURRENT_TASKS")
-    message_queue_size: int = Field(default=1000, env="MESSAGE_QUEUE_SIZE")
-    
+    max_concurrent_tasks: int = 10
+    message_queue_size: int = 1000
+
     # Monitoring Configuration
-    metrics_enabled: bool = Field(default=True, env="METRICS_ENABLED")
-    prometheus_metrics_port: int = Field(default=9090, env="PROMETHEUS_METRICS_PORT")
-    
+    metrics_enabled: bool = True
+    prometheus_metrics_port: int = 9090
+
     # Security Configuration
-    cors_origins: list = Field(default=["*"], env="CORS_ORIGINS")
-    request_timeout_seconds: int = Field(default=30, env="REQUEST_TIMEOUT_SECONDS")
-    rate_limit_requests_per_minute: int = Field(default=100, env="RATE_LIMIT_RPM")
-    
+    cors_origins: list = ["*"]
+    request_timeout_seconds: int = 30
+    rate_limit_requests_per_minute: int = Field(
+        default=100, validation_alias="RATE_LIMIT_RPM"
+    )
+
     # External Services
-    openai_api_key: Optional[str] = Field(default=None, env="OPENAI_API_KEY")
-    anthropic_api_key: Optional[str] = Field(default=None, env="ANTHROPIC_API_KEY")
-    
+    openai_api_key: Optional[str] = None
+    anthropic_api_key: Optional[str] = None
+
     # Project Prometheus Specific
-    project_name: str = Field(default="Project Prometheus", env="PROJECT_NAME")
-    project_version: str = Field(default="0.1.0", env="PROJECT_VERSION")
-    
+    project_name: str = "Project Prometheus"
+    project_version: str = "0.1.0"
+
     # Research Configuration
-    default_research_phases: list = Field(
-        default=[
-            "initialization",
-            "architecture_design", 
-            "symbolic_reasoning_development",
-            "embodied_learning",
-            "safety_validation",
-            "integration_testing",
-            "deployment"
-        ],
-        env="DEFAULT_RESEARCH_PHASES"
-    )
-    
+    default_research_phases: list = [
+        "initialization",
+        "architecture_design", 
+        "symbolic_reasoning_development",
+        "embodied_learning",
+        "safety_validation",
+        "integration_testing",
+        "deployment"
+    ]
+
     # Simulation Configuration
-    simulation_environments_enabled: bool = Field(default=True, env="SIMULATION_ENABLED")
-    max_simulation_steps: int = Field(default=10000, env="MAX_SIMULATION_STEPS")
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    simulation_environments_enabled: bool = Field(
+        default=True, validation_alias="SIMULATION_ENABLED"
+    )
+    max_simulation_steps: int = 10000
 
 
 @lru_cache()
@@ -97,32 +108,57 @@ def get_settings() -> Settings:
     return Settings()
 
 
+@lru_cache(maxsize=1)
 def get_database_url() -> Optional[str]:
     """Get database URL from settings or environment."""
     settings = get_settings()
     return settings.database_url or os.getenv("DATABASE_URL")
 
 
+@lru_cache(maxsize=1)
 def get_redis_url() -> str:
     """Get Redis URL from settings."""
     settings = get_settings()
     return settings.redis_url
 
 
+@lru_cache(maxsize=1)
 def is_development() -> bool:
     """Check if running in development environment."""
     settings = get_settings()
-    return settings.environment.lower() in ["development", "dev", "local"]
+    return settings.environment.lower() in ("development", "dev", "local")
 
 
+@lru_cache(maxsize=1)
 def is_production() -> bool:
     """Check if running in production environment."""
     settings = get_settings()
-    return settings.environment.lower() in ["production", "prod"]
+    return settings.environment.lower() in ("production", "prod")
+
+
+def log_level_enabled(level: int) -> bool:
+    """Report whether app loggers would emit records at `level`.
 
+    Consults the stdlib "prometheus" logger that get_log_config targets.
+    A tree with no handlers anywhere means nothing has configured
+    logging, in which case structlog is still on its default printer —
+    which emits every level — so this reports enabled rather than the
+    root logger's implicit WARNING. isEnabledFor caches its verdict and
+    invalidates when levels change, so callers can re-check per call.
+    """
+    std_logger = logging.getLogger("prometheus")
+    if not std_logger.hasHandlers():
+        return True
+    return std_logger.isEnabledFor(level)
 
+
+@lru_cache(maxsize=1)
 def get_log_config() -> dict:
-    """Get logging configuration."""
+    """Get logging configuration.
+
+    Built once per process and the same dict returned on every call;
+    callers must treat it as read-only.
+    """
     settings = get_settings()
     
     return {
@@ -1,11 +1,13 @@
 """
 Base agent implementation for the Prometheus multi-agent system.
 """
-from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 
 import structlog
 
+from ..config.settings import log_level_enabled
 from .domain import (
     AgentId,
     AgentProtocol,
@@ -21,8 +23,37 @@ from .domain import (
 logger = structlog.get_logger()
 
 
-class BaseAgent(ABC):
-    """Base class for all agents in the Prometheus system."""
+class BaseAgent:
+    """Base class for all agents in the Prometheus system.
+
+    A plain class rather than an ABC: ABCMeta adds C-level bookkeeping to
+    every instantiation, which adds up when agents are spawned per task.
+    Required overrides are enforced once per subclass definition via
+    __init_subclass__ instead of once per instance.
+    """
+
+    __slots__ = (
+        "_id",
+        "_id_str",
+        "_type",
+        "_event_bus",
+        "_task_repository",
+        "_is_active",
+        "_subordinates",
+        "_subordinates_view",
+        "_subordinate_id_strs",
+        "_supervisor",
+        "_supervisor_str",
+        "_logger",
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in ("_process_message_internal", "_execute_task_internal"):
+            if getattr(cls, name) is getattr(BaseAgent, name):
+                raise TypeError(
+                    f"{cls.__name__} must override {name}"
+                )
 
     def __init__(
         self,
@@ -32,19 +63,42 @@ class BaseAgent(ABC):
         task_repository: Optional[Repository] = None,
     ):
         self._id = agent_id or AgentId()
+        # Rendered once; hierarchy bookkeeping and logging read this
+        # constantly and a slot read beats re-stringifying the UUID.
+        self._id_str = str(self._id)
         self._type = agent_type
         self._event_bus = event_bus
         self._task_repository = task_repository
         self._is_active = False
-        self._subordinates: List[AgentId] = []
+        self._subordinates: Set[AgentId] = set()
+        self._subordinates_view: Optional[Tuple[AgentId, ...]] = None
+        self._subordinate_id_strs: Set[str] = set()
         self._supervisor: Optional[AgentId] = None
-        self._logger = logger.bind(agent_id=str(self._id), agent_type=str(self._type))
+        self._supervisor_str: Optional[str] = None
+        self._logger = logger.bind(agent_id=self._id_str, agent_type=str(self._type))
+
+    @property
+    def _debug_enabled(self) -> bool:
+        """Whether DEBUG-level logs would be emitted.
+
+        Message hot paths consult this to skip building debug kwargs
+        (UUID stringification per message) when DEBUG is off. Re-checked
+        per use — isEnabledFor caches its verdict, so this stays cheap —
+        rather than frozen at construction, so it tracks whatever
+        logging configuration is actually in effect.
+        """
+        return log_level_enabled(logging.DEBUG)
 
     @property
     def id(self) -> AgentId:
         """Get agent ID."""
         return self._id
 
+    @property
+    def id_str(self) -> str:
+        """String form of the agent ID, rendered once at construction."""
+        return self._id_str
+
     @property
     def type(self) -> Optional[AgentType]:
         """Get agent type."""
@@ -56,15 +110,32 @@ class BaseAgent(ABC):
         return self._is_active
 
     @property
-    def subordinates(self) -> List[AgentId]:
-        """Get list of subordinate agents."""
-        return self._subordinates.copy()
+    def subordinates(self) -> Tuple[AgentId, ...]:
+        """Get a read-only view of subordinate agents (unordered).
+
+        The tuple is cached between mutations, so iterating callers pay
+        no per-read copy; it is immutable, so handing out the shared
+        instance is safe.
+        """
+        if self._subordinates_view is None:
+            self._subordinates_view = tuple(self._subordinates)
+        return self._subordinates_view
+
+    @property
+    def subordinate_id_strs(self) -> Set[str]:
+        """String forms of the subordinate IDs (treat as read-only)."""
+        return self._subordinate_id_strs
 
     @property
     def supervisor(self) -> Optional[AgentId]:
         """Get supervisor agent ID."""
         return self._supervisor
 
+    @property
+    def supervisor_str(self) -> Optional[str]:
+        """String form of the supervisor ID, rendered when assigned."""
+        return self._supervisor_str
+
     def get_id(self) -> AgentId:
         """Get agent identifier."""
         return self._id
@@ -90,19 +161,24 @@ class BaseAgent(ABC):
     def add_subordinate(self, subordinate_id: AgentId) -> None:
         """Add a subordinate agent."""
         if subordinate_id not in self._subordinates:
-            self._subordinates.append(subordinate_id)
+            self._subordinates.add(subordinate_id)
+            self._subordinates_view = None
+            self._subordinate_id_strs.add(str(subordinate_id))
             self._logger.info("Added subordinate", subordinate_id=str(subordinate_id))
 
     def remove_subordinate(self, subordinate_id: AgentId) -> None:
         """Remove a subordinate agent."""
         if subordinate_id in self._subordinates:
-            self._subordinates.remove(subordinate_id)
+            self._subordinates.discard(subordinate_id)
+            self._subordinates_view = None
+            self._subordinate_id_strs.discard(str(subordinate_id))
             self._logger.info("Removed subordinate", subordinate_id=str(subordinate_id))
 
     def set_supervisor(self, supervisor_id: AgentId) -> None:
         """Set supervisor agent."""
         self._supervisor = supervisor_id
-        self._logger.info("Set supervisor", supervisor_id=str(supervisor_id))
+        self._supervisor_str = str(supervisor_id)
+        self._logger.info("Set supervisor", supervisor_id=self._supervisor_str)
 
     async def send_message(self, receiver_id: AgentId, content: Dict[str, Any], message_type: str = "general") -> None:
         """Send message to another agent."""
@@ -117,12 +193,28 @@ class BaseAgent(ABC):
             message_type=message_type,
         )
         await self._event_bus.publish(message)
-        self._logger.debug("Sent message", receiver_id=str(receiver_id), message_type=message_type)
+        if self._debug_enabled:
+            self._logger.debug("Sent message", receiver_id=str(receiver_id), message_type=message_type)
 
     async def broadcast_to_subordinates(self, content: Dict[str, Any], message_type: str = "broadcast") -> None:
         """Broadcast message to all subordinates."""
-        for subordinate_id in self._subordinates:
-            await self.send_message(subordinate_id, content, message_type)
+        if not self._event_bus:
+            self._logger.error("No event bus configured")
+            return
+
+        # Build the messages up front and hand the batch to the bus, so
+        # the fan-out overlaps publishes (or pipelines them) instead of
+        # paying one serial round trip per subordinate.
+        messages = [
+            Message(
+                sender_id=self._id,
+                receiver_id=subordinate_id,
+                content=content,
+                message_type=message_type,
+            )
+            for subordinate_id in self._subordinates
+        ]
+        await self._event_bus.publish_many(messages)
 
     async def report_to_supervisor(self, content: Dict[str, Any], message_type: str = "report") -> None:
         """Send report to supervisor."""
@@ -132,7 +224,8 @@ class BaseAgent(ABC):
     async def _handle_message(self, message: Message) -> None:
         """Handle incoming message."""
         try:
-            self._logger.debug("Received message", sender_id=str(message.sender_id), message_type=message.message_type)
+            if self._debug_enabled:
+                self._logger.debug("Received message", sender_id=str(message.sender_id), message_type=message.message_type)
             response = await self.process_message(message)
             if response:
                 await self._event_bus.publish(response)
@@ -141,28 +234,42 @@ class BaseAgent(ABC):
 
     async def process_message(self, message: Message) -> Optional[Message]:
         """Process incoming message. Override in subclasses."""
-        self._logger.debug("Processing message", message_type=message.message_type)
+        if self._debug_enabled:
+            self._logger.debug("Processing message", message_type=message.message_type)
         return await self._process_message_internal(message)
 
-    @abstractmethod
     async def _process_message_internal(self, message: Message) -> Optional[Message]:
         """Internal message processing. Must be implemented by subclasses."""
-        pass
+        raise NotImplementedError
+
+    # How long a task must run before its in-progress state is worth
+    # persisting; shorter tasks go straight to their terminal-state save.
+    _IN_PROGRESS_SAVE_DELAY_SECONDS = 0.05
 
     async def execute_task(self, task: Task) -> Task:
         """Execute assigned task."""
+        progress_save: Optional[asyncio.Task] = None
         try:
             self._logger.info("Starting task execution", task_id=str(task.id))
             task.mark_in_progress()
             
+            # The in-progress state is only observable when execution
+            # outlasts the durability window; for short tasks the terminal
+            # save supersedes it, so defer the write and cancel it if
+            # completion wins the race. Halves state writes per short task,
+            # and hides the save round trip behind the safety checks and
+            # execution running below. A TaskGroup is deliberately not
+            # used: joining it would block execution on the delay window.
             if self._task_repository:
-                await self._task_repository.save(task)
+                progress_save = asyncio.create_task(self._delayed_save(task))
+                progress_save.add_done_callback(self._on_progress_save_done)
 
-            # Perform safety checks before execution
-            safety_results = await self._perform_safety_checks(task)
-            if any(check.status == "failed" for check in safety_results):
-                task.mark_failed("Safety check failed")
-                return task
+            # Perform safety checks before execution, stopping at the
+            # first failure so remaining checks never run.
+            async for check in self._perform_safety_checks(task):
+                if check.status == "failed":
+                    task.mark_failed("Safety check failed")
+                    return task
 
             # Execute the actual task
             result = await self._execute_task_internal(task)
@@ -173,30 +280,65 @@ class BaseAgent(ABC):
         except Exception as e:
             self._logger.error("Task execution failed", task_id=str(task.id), error=str(e))
             task.mark_failed(str(e))
+        finally:
+            if progress_save:
+                progress_save.cancel()
         
         if self._task_repository:
-            await self._task_repository.save(task)
+            await self._save_task(task)
         
         return task
 
-    @abstractmethod
+    async def _delayed_save(self, task: Task) -> None:
+        """Persist the in-progress state once the durability window elapses."""
+        await asyncio.sleep(self._IN_PROGRESS_SAVE_DELAY_SECONDS)
+        await self._save_task(task)
+
+    def _on_progress_save_done(self, save_task: asyncio.Task) -> None:
+        """Surface background save failures instead of dropping them.
+
+        The overlapped save runs outside the execute_task await chain, so
+        its exception would otherwise only appear as a destructor warning.
+        A failed in-progress write is non-fatal: the terminal save still
+        persists the authoritative state.
+        """
+        if save_task.cancelled():
+            return
+        error = save_task.exception()
+        if error:
+            self._logger.error("In-progress task save failed", error=str(error))
+
+    async def _save_task(self, task: Task) -> None:
+        """Persist a task, preferring the repository's batched save path."""
+        save = getattr(self._task_repository, "save_batched", None)
+        if save is not None:
+            await save(task)
+        else:
+            await self._task_repository.save(task)
+
     async def _execute_task_internal(self, task: Task) -> Dict[str, Any]:
         """Internal task execution. Must be implemented by subclasses."""
-        pass
+        raise NotImplementedError
+
+    async def _perform_safety_checks(self, task: Task) -> AsyncIterator[SafetyCheck]:
+        """Yield safety checks to run before task execution.
 
-    async def _perform_safety_checks(self, task: Task) -> List[SafetyCheck]:
-        """Perform safety checks before task execution."""
-        # Base implementation - override in subclasses for specific checks
-        return []
+        Subclasses override this as an async generator, yielding checks
+        in order of increasing cost; execution aborts on the first
+        failure, so expensive checks after a failing cheap one are never
+        evaluated. The base implementation yields nothing.
+        """
+        return
+        yield  # pragma: no cover - makes this an async generator
 
     async def get_status(self) -> Dict[str, Any]:
         """Get agent status information."""
         return {
-            "id": str(self._id),
-            "type": str(self._type) if self._type else None,
+            "id": self._id_str,
+            "type": self._type.value if self._type else None,
             "active": self._is_active,
-            "subordinates": [str(sub_id) for sub_id in self._subordinates],
-            "supervisor": str(self._supervisor) if self._supervisor else None,
+            "subordinates": list(self._subordinate_id_strs),
+            "supervisor": self._supervisor_str,
         }
 
     async def get_health(self) -> Dict[str, Any]:
@@ -1,11 +1,14 @@
 """
 Core domain entities and value objects for Project Prometheus.
 """
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Protocol, Union
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, List, Optional, Protocol, Tuple, Union
 from uuid import UUID, uuid4
 
 import structlog
@@ -39,25 +42,33 @@ class Priority(Enum):
     CRITICAL = 4
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentId:
     """Value object for agent identification."""
     value: UUID = field(default_factory=uuid4)
+    _str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def __str__(self) -> str:
-        return str(self.value)
+        # Message routing and logging stringify ids repeatedly; render
+        # the 36-char hex form once per object instead of per call.
+        if self._str is None:
+            object.__setattr__(self, "_str", str(self.value))
+        return self._str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskId:
     """Value object for task identification."""
     value: UUID = field(default_factory=uuid4)
+    _str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def __str__(self) -> str:
-        return str(self.value)
+        if self._str is None:
+            object.__setattr__(self, "_str", str(self.value))
+        return self._str
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Inter-agent communication message."""
     id: UUID = field(default_factory=uuid4)
@@ -68,7 +79,7 @@ class Message:
     message_type: str = "general"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Task entity for agent execution."""
     id: TaskId = field(default_factory=TaskId)
@@ -78,11 +89,67 @@ class Task:
     priority: Priority = Priority.MEDIUM
     status: TaskStatus = TaskStatus.PENDING
     created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    # Shares created_at's object on construction (see __post_init__)
+    # rather than taking a second clock reading per task.
+    updated_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Slot-backed caches for the string-form properties below.
+    _agent_id_str: Optional[Tuple[AgentId, str]] = field(default=None, init=False, repr=False, compare=False)
+    _created_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _updated_iso: Optional[Tuple[datetime, str]] = field(default=None, init=False, repr=False, compare=False)
+    _completed_iso: Optional[Tuple[datetime, str]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.updated_at is None:
+            self.updated_at = self.created_at
+
+    @property
+    def agent_id_str(self) -> str:
+        """String form of agent_id, re-rendered only on reassignment.
+
+        Stats and monitoring loops read this per task; status.value and
+        priority.name need no such cache because enum members already
+        hand back their shared interned string.
+        """
+        cached = self._agent_id_str
+        if cached is None or cached[0] is not self.agent_id:
+            cached = (self.agent_id, str(self.agent_id))
+            self._agent_id_str = cached
+        return cached[1]
+
+    @property
+    def created_iso(self) -> str:
+        """ISO form of created_at, rendered once per task."""
+        if self._created_iso is None:
+            self._created_iso = self.created_at.isoformat()
+        return self._created_iso
+
+    @property
+    def updated_iso(self) -> str:
+        """ISO form of updated_at, re-rendered only when the datetime changes."""
+        cached = self._updated_iso
+        if cached is None or cached[0] is not self.updated_at:
+            cached = (self.updated_at, self.updated_at.isoformat())
+            self._updated_iso = cached
+        return cached[1]
+
+    @property
+    def completed_iso(self) -> Optional[str]:
+        """ISO form of completed_at, or None while the task is unfinished."""
+        if self.completed_at is None:
+            return None
+        cached = self._completed_iso
+        if cached is None or cached[0] is not self.completed_at:
+            cached = (self.completed_at, self.completed_at.isoformat())
+            self._completed_iso = cached
+        return cached[1]
+
+    def touch(self) -> None:
+        """Record that the task was modified."""
+        self.updated_at = datetime.utcnow()
 
     def mark_in_progress(self) -> None:
         """Mark task as in progress."""
@@ -91,10 +158,11 @@ class Task:
 
     def mark_completed(self, result: Dict[str, Any]) -> None:
         """Mark task as completed with result."""
+        now = datetime.utcnow()
         self.status = TaskStatus.COMPLETED
         self.result = result
-        self.completed_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self.completed_at = now
+        self.updated_at = now
 
     def mark_failed(self, error: str) -> None:
         """Mark task as failed with error."""
@@ -131,7 +199,7 @@ class SafetyViolation(Exception):
         self.severity = severity
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SafetyCheck:
     """Safety check result."""
     id: UUID = field(default_factory=uuid4)
@@ -143,6 +211,24 @@ class SafetyCheck:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@lru_cache(maxsize=32)
+def _criteria_predicate(attrs: Tuple[str, ...]):
+    """Compile a matcher specialized for one criteria key shape.
+
+    Filter shapes repeat (dashboards poll the same few), so the
+    per-entity key iteration and dispatch is generated once per shape
+    as a single boolean expression and cached, instead of being
+    re-evaluated for every entity on every call.
+    """
+    checks = " and ".join(
+        f"getattr(entity, {attr!r}, None) == values[{i}]"
+        for i, attr in enumerate(attrs)
+    ) or "True"
+    namespace: Dict[str, Any] = {}
+    exec(compile(f"def _match(entity, values):\n    return {checks}\n", __name__, "exec"), namespace)
+    return namespace["_match"]
+
+
 class Repository(ABC):
     """Abstract repository interface."""
     
@@ -166,6 +252,35 @@ class Repository(ABC):
         """Delete entity by ID."""
         pass
 
+    async def save_many(self, entities: List[Any]) -> None:
+        """Save a batch of entities.
+
+        Backends that can submit a batch in one round trip should
+        override this; the default overlaps individual saves.
+        """
+        await asyncio.gather(*(self.save(entity) for entity in entities))
+
+    async def find_by_criteria(
+        self,
+        criteria: Dict[str, Any],
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Any]:
+        """Find entities matching attribute criteria.
+
+        Backends with secondary indexes should override this to push the
+        predicate (and pagination) down; the default filters a full
+        listing in Python with a predicate compiled per criteria shape,
+        and materializes only the requested page.
+        """
+        match = _criteria_predicate(tuple(criteria))
+        values = tuple(criteria.values())
+        matches = (
+            entity for entity in await self.list_all() if match(entity, values)
+        )
+        stop = None if limit is None else offset + limit
+        return list(islice(matches, offset, stop))
+
 
 class EventBus(ABC):
     """Abstract event bus for inter-agent communication."""
@@ -175,6 +290,14 @@ class EventBus(ABC):
         """Publish message to event bus."""
         pass
     
+    async def publish_many(self, messages: List[Message]) -> None:
+        """Publish a batch of messages concurrently.
+
+        Backends that can submit a batch in one round trip should
+        override this; the default overlaps individual publishes.
+        """
+        await asyncio.gather(*(self.publish(message) for message in messages))
+    
     @abstractmethod
     async def subscribe(self, agent_id: AgentId, callback) -> None:
         """Subscribe agent to receive messages."""
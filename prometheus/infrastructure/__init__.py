@@ -2,6 +2,16 @@
 Infrastructure components for Project Prometheus.
 """
 
+# The event bus and repositories are asyncio-bound on Redis I/O; uvloop's
+# libuv selector is a drop-in replacement that substantially cuts per-fd
+# wakeup and socket-call overhead. Installed here so every entrypoint
+# importing the infrastructure gets it; optional, so its absence is fine.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from .event_bus import RedisEventBus, InMemoryEventBus
 from .repositories import InMemoryRepository, RedisRepository
 
@@ -2,101 +2,352 @@
 Event bus implementation for inter-agent communication.
 """
 import asyncio
-import json
-from typing import Any, Callable, Dict, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from uuid import UUID
 
+import msgpack
+import orjson
 import redis.asyncio as redis
 import structlog
 
 from ..core.domain import AgentId, EventBus, Message
+from .redis_client import get_redis_client
 
 logger = structlog.get_logger()
 
 
+@lru_cache(maxsize=4096)
+def _channel_for(agent_uuid: UUID) -> bytes:
+    """Redis channel for an agent, rendered and UTF-8 encoded once.
+
+    Pre-encoding to bytes also spares the client library its internal
+    re-encode on every publish.
+    """
+    return f"agent:{agent_uuid}".encode()
+
+
 class RedisEventBus(EventBus):
     """Redis-based event bus for inter-agent communication."""
 
-    def __init__(self, redis_url: str = "redis://localhost:6379"):
+    # Publishes queued within one flush tick go out as a single pipelined
+    # round trip; the cap bounds pipeline memory under sustained load.
+    _MAX_PUBLISH_BATCH = 64
+    # One pattern subscription covers every agent channel in this
+    # process, so per-agent SUBSCRIBE round trips disappear.
+    _CHANNEL_PATTERN = b"agent:*"
+    # Shared channel for one-to-all messages: a broadcast is a single
+    # PUBLISH here, fanned out to local subscribers on arrival.
+    _BROADCAST_CHANNEL = b"prometheus:broadcast"
+    # Messages handled per listener wakeup; amortizes the scheduler cost
+    # of the await per message when traffic bursts.
+    _MAX_DRAIN_BATCH = 32
+    # Content above this many bytes encodes in the thread pool so a big
+    # payload doesn't stall every other coroutine on the loop.
+    _OFFLOAD_ENCODE_BYTES = 16384
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379",
+        serializer: str = "msgpack",
+        redis_client: Optional[redis.Redis] = None,
+    ):
         self.redis_url = redis_url
-        self._redis_client: Optional[redis.Redis] = None
+        # "msgpack" (default) halves payload size and skips text escaping;
+        # "json" keeps the wire format human-readable for debugging.
+        self._serializer = serializer
+        self._redis_client = redis_client
         self._pubsub: Optional[redis.client.PubSub] = None
-        self._subscribers: Dict[str, Callable] = {}
+        # Keyed by the raw channel bytes Redis delivers, so inbound
+        # routing is one dict probe with no decode or str() per message.
+        self._subscribers: Dict[bytes, Callable] = {}
         self._running = False
+        self._send_queue: asyncio.Queue = asyncio.Queue()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._listener_task: Optional[asyncio.Task] = None
 
     async def connect(self) -> None:
         """Connect to Redis."""
-        self._redis_client = redis.from_url(self.redis_url)
+        if self._redis_client is None:
+            self._redis_client = get_redis_client(self.redis_url)
         self._pubsub = self._redis_client.pubsub()
         await self._redis_client.ping()
+        await self._pubsub.psubscribe(self._CHANNEL_PATTERN)
+        await self._pubsub.subscribe(self._BROADCAST_CHANNEL)
+        self._running = True
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        self._listener_task = asyncio.create_task(self._message_listener())
         logger.info("Connected to Redis event bus")
 
+    async def ping(self) -> None:
+        """Round-trip to Redis on a pooled connection.
+
+        Concurrent pings force the pool to open that many sockets, which
+        is exactly what warm-up callers want.
+        """
+        if not self._redis_client:
+            await self.connect()
+        await self._redis_client.ping()
+
     async def disconnect(self) -> None:
         """Disconnect from Redis."""
         self._running = False
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        # Anything still queued will never be flushed; fail its futures
+        # so publishers awaiting an ack don't hang forever.
+        pending = []
+        while not self._send_queue.empty():
+            pending.append(self._send_queue.get_nowait())
+        if pending:
+            self._fail_publishes(pending)
+            logger.warning("Dropped queued publishes on disconnect", count=len(pending))
+        if self._listener_task:
+            self._listener_task.cancel()
+            self._listener_task = None
         if self._pubsub:
             await self._pubsub.close()
         if self._redis_client:
             await self._redis_client.close()
         logger.info("Disconnected from Redis event bus")
 
-    async def publish(self, message: Message) -> None:
-        """Publish message to event bus."""
+    @staticmethod
+    def _fail_publishes(items: List[Tuple[bytes, Any, Optional[asyncio.Future]]]) -> None:
+        """Fail the futures of publishes that will never reach Redis."""
+        error = ConnectionError("Event bus disconnected before publish was flushed")
+        for _, _, future in items:
+            if future is not None and not future.done():
+                future.set_exception(error)
+
+    @classmethod
+    def _is_large_content(cls, content: Dict[str, Any]) -> bool:
+        """Cheap probe for oversized content.
+
+        Only top-level string/bytes values are measured, keeping the
+        check O(items) instead of pre-serializing the whole payload;
+        deeply nested large values slip through, which merely means they
+        encode inline.
+        """
+        total = 0
+        for value in content.values():
+            if isinstance(value, (str, bytes)):
+                total += len(value)
+                if total >= cls._OFFLOAD_ENCODE_BYTES:
+                    return True
+        return False
+
+    def _encode_message(
+        self, message: Message, content_blob: Optional[bytes] = None
+    ) -> Tuple[bytes, Any]:
+        """Render a message into its channel and wire payload.
+
+        content_blob, when given, is the message content already packed
+        as a msgpack bin value; fan-out paths pass it so a dict shared
+        across N envelopes encodes once instead of N times.
+        """
+        channel = _channel_for(message.receiver_id.value)
+        if self._serializer == "msgpack":
+            # Raw 16-byte UUIDs and an epoch timestamp instead of hex
+            # strings and ISO text: ~20 bytes saved per id, no escaping.
+            payload = msgpack.packb(
+                {
+                    "id": message.id.bytes,
+                    "sender_id": message.sender_id.value.bytes,
+                    "receiver_id": message.receiver_id.value.bytes,
+                    "content": content_blob if content_blob is not None else message.content,
+                    "timestamp": message.timestamp.timestamp(),
+                    "message_type": message.message_type,
+                },
+                use_bin_type=True,
+            )
+        else:
+            # orjson renders UUID and datetime natively, straight to bytes.
+            payload = orjson.dumps({
+                "id": message.id,
+                "sender_id": message.sender_id.value,
+                "receiver_id": message.receiver_id.value,
+                "content": message.content,
+                "timestamp": message.timestamp,
+                "message_type": message.message_type,
+            })
+        return channel, payload
+
+    def _decode_message(self, raw: bytes) -> Message:
+        """Parse a wire payload back into a Message."""
+        if self._serializer == "msgpack":
+            data = msgpack.unpackb(raw, raw=False)
+            content = data["content"]
+            if isinstance(content, bytes):
+                # Pre-packed shared content from a fan-out encode.
+                content = msgpack.unpackb(content, raw=False)
+            return Message(
+                id=UUID(bytes=data["id"]),
+                sender_id=AgentId(UUID(bytes=data["sender_id"])),
+                receiver_id=AgentId(UUID(bytes=data["receiver_id"])),
+                content=content,
+                message_type=data["message_type"],
+            )
+        data = orjson.loads(raw)
+        return Message(
+            id=UUID(data["id"]),
+            sender_id=AgentId(UUID(data["sender_id"])),
+            receiver_id=AgentId(UUID(data["receiver_id"])),
+            content=data["content"],
+            message_type=data["message_type"],
+        )
+
+    async def publish(self, message: Message, ack: bool = True) -> None:
+        """Publish message to event bus.
+
+        Publishes are funnelled through a coalescing queue: concurrent
+        publishers within a flush tick share one pipelined round trip
+        instead of paying one PUBLISH RTT each. With ack=True (default)
+        this resolves once the message has been handed to Redis; ack=False
+        returns as soon as the message is queued, trading the delivery
+        guarantee for zero round-trip wait — at most once, suitable for
+        non-critical notifications where a lost message is acceptable.
+        """
         if not self._redis_client:
             await self.connect()
 
-        channel = f"agent:{message.receiver_id}"
-        message_data = {
-            "id": str(message.id),
-            "sender_id": str(message.sender_id),
-            "receiver_id": str(message.receiver_id),
-            "content": message.content,
-            "timestamp": message.timestamp.isoformat(),
-            "message_type": message.message_type,
-        }
-
-        await self._redis_client.publish(channel, json.dumps(message_data))
+        if self._is_large_content(message.content):
+            # Encode off-loop; the pool thread holds the GIL only inside
+            # the C encoder, so the loop keeps serving other coroutines.
+            channel, payload = await asyncio.get_running_loop().run_in_executor(
+                None, self._encode_message, message
+            )
+        else:
+            channel, payload = self._encode_message(message)
+        if not ack:
+            self._send_queue.put_nowait((channel, payload, None))
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._send_queue.put_nowait((channel, payload, future))
+        await future
         logger.debug("Message published", 
                     sender=str(message.sender_id),
                     receiver=str(message.receiver_id),
                     type=message.message_type)
 
+    async def broadcast(self, message: Message) -> None:
+        """Publish one message to the shared broadcast channel.
+
+        All processes' subscribers receive it via their broadcast
+        subscription, so a system-wide announcement costs one PUBLISH
+        regardless of agent count.
+        """
+        if not self._redis_client:
+            await self.connect()
+
+        _, payload = self._encode_message(message)
+        await self._redis_client.publish(self._BROADCAST_CHANNEL, payload)
+        logger.debug("Broadcast published", sender=str(message.sender_id), type=message.message_type)
+
+    async def publish_many(self, messages: List[Message]) -> None:
+        """Publish a batch of messages in one pipelined round trip."""
+        if not messages:
+            return
+        if not self._redis_client:
+            await self.connect()
+
+        # Broadcast-style batches share one content dict across every
+        # envelope; memoize its packed form by object identity so the
+        # batch encodes it once.
+        content_blobs: Dict[int, bytes] = {}
+        use_blobs = self._serializer == "msgpack"
+        pipe = self._redis_client.pipeline(transaction=False)
+        for message in messages:
+            blob = None
+            if use_blobs:
+                key = id(message.content)
+                blob = content_blobs.get(key)
+                if blob is None:
+                    blob = content_blobs[key] = msgpack.packb(
+                        message.content, use_bin_type=True
+                    )
+            channel, payload = self._encode_message(message, content_blob=blob)
+            pipe.publish(channel, payload)
+        await pipe.execute()
+        logger.debug("Message batch published", count=len(messages))
+
+    async def _flush_loop(self) -> None:
+        """Drain the publish queue in pipelined batches."""
+        while True:
+            items = [await self._send_queue.get()]
+            try:
+                # One cooperative yield lets concurrently-publishing tasks
+                # append to this batch before it flushes.
+                await asyncio.sleep(0)
+                while not self._send_queue.empty() and len(items) < self._MAX_PUBLISH_BATCH:
+                    items.append(self._send_queue.get_nowait())
+
+                pipe = self._redis_client.pipeline(transaction=False)
+                for channel, payload, _ in items:
+                    pipe.publish(channel, payload)
+                await pipe.execute()
+            except asyncio.CancelledError:
+                # Cancelled mid-flush (disconnect): this batch already
+                # left the queue, so disconnect's drain can't see it —
+                # its futures must be failed here.
+                self._fail_publishes(items)
+                raise
+            except Exception as e:
+                # Unacked (fire-and-forget) publishes carry no future to
+                # fail; the error is logged on their behalf.
+                if any(future is None for _, _, future in items):
+                    logger.error("Dropped unacked publishes", error=str(e))
+                for _, _, future in items:
+                    if future is not None and not future.done():
+                        future.set_exception(e)
+            else:
+                for _, _, future in items:
+                    if future is not None and not future.done():
+                        future.set_result(None)
+
     async def subscribe(self, agent_id: AgentId, callback: Callable[[Message], None]) -> None:
-        """Subscribe agent to receive messages."""
+        """Subscribe agent to receive messages.
+
+        The pattern subscription established at connect() already covers
+        every agent channel, so registering is a local dict write with no
+        Redis round trip.
+        """
         if not self._redis_client:
             await self.connect()
 
-        channel = f"agent:{agent_id}"
-        self._subscribers[str(agent_id)] = callback
-        
-        await self._pubsub.subscribe(channel)
-        
-        if not self._running:
-            self._running = True
-            asyncio.create_task(self._message_listener())
-        
+        self._subscribers[_channel_for(agent_id.value)] = callback
         logger.info("Agent subscribed to event bus", agent_id=str(agent_id))
 
     async def unsubscribe(self, agent_id: AgentId) -> None:
         """Unsubscribe agent from receiving messages."""
-        if not self._pubsub:
-            return
-
-        channel = f"agent:{agent_id}"
-        await self._pubsub.unsubscribe(channel)
-        
-        if str(agent_id) in self._subscribers:
-            del self._subscribers[str(agent_id)]
-        
+        self._subscribers.pop(_channel_for(agent_id.value), None)
         logger.info("Agent unsubscribed from event bus", agent_id=str(agent_id))
 
     async def _message_listener(self) -> None:
-        """Listen for incoming messages and route to subscribers."""
+        """Listen for incoming messages and route to subscribers.
+
+        Each wakeup drains whatever has already arrived (up to the batch
+        cap) and handles the batch concurrently, instead of paying one
+        await cycle per message.
+        """
         while self._running:
             try:
                 message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
-                if message:
-                    await self._handle_message(message)
+                if not message:
+                    continue
+                batch = [message]
+                while len(batch) < self._MAX_DRAIN_BATCH:
+                    extra = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=0)
+                    if not extra:
+                        break
+                    batch.append(extra)
+                await asyncio.gather(*(self._handle_message(m) for m in batch))
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 logger.error("Error in message listener", error=str(e))
                 await asyncio.sleep(1)
@@ -104,23 +355,24 @@ class RedisEventBus(EventBus):
     async def _handle_message(self, redis_message: Dict[str, Any]) -> None:
         """Handle incoming Redis message."""
         try:
-            channel = redis_message["channel"].decode("utf-8")
-            data = json.loads(redis_message["data"])
-            
-            # Parse message
-            message = Message(
-                id=UUID(data["id"]),
-                sender_id=AgentId(UUID(data["sender_id"])),
-                receiver_id=AgentId(UUID(data["receiver_id"])),
-                content=data["content"],
-                message_type=data["message_type"],
-            )
-            
-            # Route to appropriate callback
-            receiver_id = str(message.receiver_id)
-            if receiver_id in self._subscribers:
-                callback = self._subscribers[receiver_id]
-                await callback(message)
+            # Route on the raw channel bytes; messages for receivers
+            # without a local subscriber are dropped before paying for a
+            # payload decode.
+            channel = redis_message["channel"]
+            if channel == self._BROADCAST_CHANNEL:
+                message = self._decode_message(redis_message["data"])
+                sender_channel = _channel_for(message.sender_id.value)
+                await asyncio.gather(*(
+                    callback(message)
+                    for subscriber_channel, callback in self._subscribers.items()
+                    if subscriber_channel != sender_channel
+                ))
+                return
+            callback = self._subscribers.get(channel)
+            if callback is None:
+                return
+            message = self._decode_message(redis_message["data"])
+            await callback(message)
                 
         except Exception as e:
             logger.error("Error handling message", error=str(e))
@@ -129,18 +381,73 @@ class RedisEventBus(EventBus):
 class InMemoryEventBus(EventBus):
     """In-memory event bus for testing and development."""
 
+    # Sentinel pushed by stop() so the processor wakes once and exits,
+    # instead of polling a flag on a 1s timeout.
+    _STOP = object()
+
+    # Power-of-two ring capacity so the wrap is a single bit-mask. The
+    # ring replaces asyncio.Queue: a slot store plus one Event instead of
+    # a deque and a waiter future allocated per put, which is safe here
+    # because the single event loop serializes producer and consumer.
+    _RING_CAPACITY = 1 << 14
+
     def __init__(self):
         self._subscribers: Dict[str, Callable] = {}
-        self._message_queue: asyncio.Queue = asyncio.Queue()
-        self._running = False
+        self._ring: List[Any] = [None] * self._RING_CAPACITY
+        self._head = 0
+        self._tail = 0
+        self._ready = asyncio.Event()
+        self._processor_task: Optional[asyncio.Task] = None
+
+    async def _enqueue(self, item: Any) -> None:
+        """Append an item to the ring, yielding while it is full."""
+        while self._tail - self._head >= self._RING_CAPACITY:
+            # Backpressure: let the processor drain a slot.
+            await asyncio.sleep(0)
+        self._ring[self._tail & (self._RING_CAPACITY - 1)] = item
+        self._tail += 1
+        self._ready.set()
+
+    async def connect(self) -> None:
+        """Start the message processor."""
+        if self._processor_task is None or self._processor_task.done():
+            self._processor_task = asyncio.create_task(self._message_processor())
+
+    async def disconnect(self) -> None:
+        """Stop the message processor."""
+        await self.stop()
 
     async def publish(self, message: Message) -> None:
-        """Publish message to event bus."""
-        await self._message_queue.put(message)
-        
-        if not self._running:
-            self._running = True
-            asyncio.create_task(self._message_processor())
+        """Publish message to event bus.
+
+        Messages whose receiver is subscribed locally dispatch straight
+        to the callback, skipping the queue hand-off and its two context
+        switches; only unmatched receivers go through the processor
+        queue (where a late subscriber may still pick them up).
+        """
+        callback = self._subscribers.get(str(message.receiver_id))
+        if callback is not None:
+            asyncio.get_running_loop().create_task(self._dispatch(callback, message))
+            return
+        if self._processor_task is None or self._processor_task.done():
+            await self.connect()
+        await self._enqueue(message)
+
+    async def _dispatch(self, callback: Callable, message: Message) -> None:
+        """Run a directly dispatched callback with the processor's error handling."""
+        try:
+            await callback(message)
+        except Exception as e:
+            logger.error("Error processing message", error=str(e))
+
+    async def broadcast(self, message: Message) -> None:
+        """Deliver one message to every subscriber except its sender."""
+        sender_key = str(message.sender_id)
+        await asyncio.gather(*(
+            self._dispatch(callback, message)
+            for subscriber, callback in self._subscribers.items()
+            if subscriber != sender_key
+        ))
 
     async def subscribe(self, agent_id: AgentId, callback: Callable[[Message], None]) -> None:
         """Subscribe agent to receive messages."""
@@ -154,23 +461,35 @@ class InMemoryEventBus(EventBus):
         logger.debug("Agent unsubscribed from in-memory event bus", agent_id=str(agent_id))
 
     async def _message_processor(self) -> None:
-        """Process messages from queue."""
-        while self._running:
-            try:
-                # Wait for message with timeout
-                message = await asyncio.wait_for(self._message_queue.get(), timeout=1.0)
-                
-                # Route to appropriate callback
-                receiver_id = str(message.receiver_id)
-                if receiver_id in self._subscribers:
-                    callback = self._subscribers[receiver_id]
-                    await callback(message)
-                    
-            except asyncio.TimeoutError:
-                continue
-            except Exception as e:
-                logger.error("Error processing message", error=str(e))
+        """Process messages from the ring.
+
+        Drains whatever is buffered, then parks on the ready event —
+        zero wakeups while idle — and exits when the stop sentinel
+        arrives.
+        """
+        mask = self._RING_CAPACITY - 1
+        while True:
+            while self._head != self._tail:
+                idx = self._head & mask
+                message = self._ring[idx]
+                self._ring[idx] = None  # release the slot's reference
+                self._head += 1
+                if message is self._STOP:
+                    return
+                try:
+                    # Route to appropriate callback
+                    callback = self._subscribers.get(str(message.receiver_id))
+                    if callback:
+                        await callback(message)
+                except Exception as e:
+                    logger.error("Error processing message", error=str(e))
+            self._ready.clear()
+            if self._head == self._tail:
+                await self._ready.wait()
 
     async def stop(self) -> None:
-        """Stop the message processor."""
-        self._running = False
\ No newline at end of file
+        """Stop the message processor, letting it drain queued messages."""
+        if self._processor_task and not self._processor_task.done():
+            await self._enqueue(self._STOP)
+            await self._processor_task
+        self._processor_task = None
\ No newline at end of file
@@ -1,10 +1,10 @@
 """
 Message queue implementation using Celery for background task processing.
 """
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import json
 
-from celery import Celery
+from celery import Celery, group
 import structlog
 
 logger = structlog.get_logger()
@@ -67,6 +67,41 @@ class CeleryMessageQueue:
                         task_name=task_name)
             raise
 
+    async def send_tasks_bulk(
+        self,
+        specs: List[Tuple[str, tuple, Optional[Dict[str, Any]], str]],
+    ) -> List[str]:
+        """Send a batch of tasks to the message queue in one submission.
+
+        Each spec is (task_name, args, kwargs, queue). The batch goes out
+        as a single Celery group, so the broker enqueues are pipelined
+        into one round trip instead of one per task. Returns the task ids
+        in spec order.
+        """
+        try:
+            signatures = [
+                self.celery_app.signature(
+                    task_name,
+                    args=args,
+                    kwargs=kwargs or {},
+                    queue=queue,
+                )
+                for task_name, args, kwargs, queue in specs
+            ]
+            result = group(signatures).apply_async()
+            
+            task_ids = [child.id for child in result.children]
+            
+            logger.info("Task batch sent to queue", count=len(task_ids))
+            
+            return task_ids
+            
+        except Exception as e:
+            logger.error("Error sending task batch to queue", 
+                        error=str(e), 
+                        count=len(specs))
+            raise
+
     async def get_task_result(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Get task result by ID."""
         try:
@@ -0,0 +1,29 @@
+"""
+Shared Redis client for the infrastructure layer.
+"""
+from functools import lru_cache
+
+import redis.asyncio as redis
+import structlog
+
+logger = structlog.get_logger()
+
+# Upper bound on pooled connections per process. Pub/sub listeners take a
+# dedicated connection each; everything else multiplexes the remainder.
+_MAX_CONNECTIONS = 32
+
+
+@lru_cache(maxsize=None)
+def get_redis_client(redis_url: str) -> redis.Redis:
+    """Process-wide Redis client for a URL, created once.
+
+    The event bus and repositories previously opened independent
+    connection pools per instance — duplicate sockets and kernel-side
+    contention for the same server. Sharing one pooled client lets
+    publish traffic and repository reads multiplex the same connections.
+    The pool is passed explicitly, so a component closing its client
+    handle does not tear the pool down for the others.
+    """
+    pool = redis.ConnectionPool.from_url(redis_url, max_connections=_MAX_CONNECTIONS)
+    logger.info("Created shared Redis connection pool", redis_url=redis_url)
+    return redis.Redis(connection_pool=pool)
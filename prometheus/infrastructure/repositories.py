@@ -1,29 +1,113 @@
 """
 Repository implementations for data persistence.
 """
-import json
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+from collections import defaultdict
+from datetime import datetime
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 from uuid import UUID
 
+import msgpack
+import orjson
 import redis.asyncio as redis
 import structlog
 
 from ..core.domain import AgentId, Repository, Task, TaskId
+from .redis_client import get_redis_client
 
 logger = structlog.get_logger()
 
 
+# Task's storage schema is fixed, so its serializer is generated once at
+# import time as one flat dict display: no isinstance chain, no kwargs
+# dispatch, and the interpreter specializes the single BUILD_MAP. The id
+# strings and ISO timestamps come from the entity's cached renders.
+_SERIALIZE_TASK_SRC = """\
+def _serialize_task(entity):
+    \"\"\"Render a Task into its storage dict.\"\"\"
+    return {
+        "id": str(entity.id),
+        "agent_id": entity.agent_id_str,
+        "name": entity.name,
+        "description": entity.description,
+        "priority": entity.priority.value,
+        "status": entity.status.value,
+        "created_at": entity.created_iso,
+        "updated_at": entity.updated_iso,
+        "completed_at": entity.completed_iso,
+        "result": entity.result,
+        "error": entity.error,
+        "metadata": entity.metadata,
+        "_type": "Task",
+    }
+"""
+exec(compile(_SERIALIZE_TASK_SRC, __name__, "exec"))
+
+# Specialized serializers dispatched by exact entity type; entities
+# without one fall back to the generic path in _serialize_entity.
+_SERIALIZERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {Task: _serialize_task}
+
+
+def _queryable_value(attr: str, value: Any) -> Any:
+    """Normalize an attribute or criterion to its queryable form.
+
+    Entities store enums and id objects while callers filter with plain
+    strings ("pending", a UUID string, "high"), so both sides are folded
+    to the same string form before comparison or indexing.
+    """
+    if value is None:
+        return None
+    if attr == "agent_id":
+        return str(value)
+    if attr == "status":
+        return getattr(value, "value", value)
+    if attr == "priority":
+        name = getattr(value, "name", None)
+        if name is not None:
+            return name.lower()
+        return value.lower() if isinstance(value, str) else value
+    return value
+
+
 class InMemoryRepository(Repository):
     """In-memory repository for testing and development."""
 
+    # Attributes worth an inverted index; queries on anything else fall
+    # back to scanning the (index-narrowed) candidates.
+    _indexed_attrs = ("agent_id", "status", "priority")
+
     def __init__(self):
         self._storage: Dict[str, Any] = {}
+        self._indexes: Dict[Tuple[str, Any], Set[str]] = defaultdict(set)
+        # Index entries recorded per storage key at save time. Entities
+        # are mutated in place before being re-saved, so stale entries
+        # must be removed by what was indexed, not by re-reading the
+        # (already updated) attributes.
+        self._index_entries: Dict[str, Tuple[Tuple[str, Any], ...]] = {}
+
+    def _index_entity(self, key: str, entity: Any) -> None:
+        entries = tuple(
+            (attr, _queryable_value(attr, value))
+            for attr in self._indexed_attrs
+            if (value := getattr(entity, attr, None)) is not None
+        )
+        for entry in entries:
+            self._indexes[entry].add(key)
+        self._index_entries[key] = entries
+
+    def _unindex_entity(self, key: str) -> None:
+        for entry in self._index_entries.pop(key, ()):
+            self._indexes[entry].discard(key)
 
     async def save(self, entity: Any) -> None:
         """Save entity to repository."""
         if hasattr(entity, 'id'):
             key = str(entity.id)
+            if key in self._storage:
+                self._unindex_entity(key)
             self._storage[key] = entity
+            self._index_entity(key, entity)
             logger.debug("Entity saved to in-memory repository", entity_id=key)
         else:
             raise ValueError("Entity must have an 'id' attribute")
@@ -36,48 +120,185 @@ class InMemoryRepository(Repository):
             logger.debug("Entity retrieved from in-memory repository", entity_id=key)
         return entity
 
-    async def list_all(self) -> List[Any]:
-        """List all entities."""
-        entities = list(self._storage.values())
+    async def list_all(self, offset: int = 0, limit: Optional[int] = None) -> List[Any]:
+        """List entities, materializing only the requested page."""
+        stop = None if limit is None else offset + limit
+        entities = list(islice(self._storage.values(), offset, stop))
         logger.debug("Listed all entities from in-memory repository", count=len(entities))
         return entities
 
     async def delete(self, entity_id: Union[AgentId, TaskId, UUID]) -> bool:
         """Delete entity by ID."""
         key = str(entity_id)
-        if key in self._storage:
-            del self._storage[key]
+        entity = self._storage.pop(key, None)
+        if entity is not None:
+            self._unindex_entity(key)
             logger.debug("Entity deleted from in-memory repository", entity_id=key)
             return True
         return False
 
-    async def find_by_criteria(self, criteria: Dict[str, Any]) -> List[Any]:
-        """Find entities by criteria."""
-        results = []
-        for entity in self._storage.values():
-            match = True
-            for key, value in criteria.items():
-                if not hasattr(entity, key) or getattr(entity, key) != value:
-                    match = False
-                    break
-            if match:
-                results.append(entity)
-        
+    async def find_by_criteria(
+        self,
+        criteria: Dict[str, Any],
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Any]:
+        """Find entities by criteria.
+
+        Indexed criteria resolve through set intersection instead of a
+        full scan; any remaining criteria are checked only against the
+        narrowed candidates, and only the requested page is materialized.
+        """
+        indexed = {k: v for k, v in criteria.items() if k in self._indexed_attrs}
+        rest = {k: v for k, v in criteria.items() if k not in self._indexed_attrs}
+
+        if indexed:
+            key_sets = [
+                self._indexes.get((attr, _queryable_value(attr, value)), set())
+                for attr, value in indexed.items()
+            ]
+            # Set intersection yields keys in arbitrary order; sort so
+            # paginated calls see a stable sequence and consecutive
+            # pages neither repeat nor skip entities.
+            candidates = (self._storage[k] for k in sorted(set.intersection(*key_sets)))
+        else:
+            candidates = iter(self._storage.values())
+
+        if rest:
+            candidates = (
+                entity for entity in candidates
+                if all(
+                    hasattr(entity, key) and getattr(entity, key) == value
+                    for key, value in rest.items()
+                )
+            )
+
+        stop = None if limit is None else offset + limit
+        results = list(islice(candidates, offset, stop))
+
         logger.debug("Found entities by criteria", criteria=criteria, count=len(results))
         return results
 
+    async def update_status(
+        self,
+        entity_id: Union[AgentId, TaskId, UUID],
+        new_status: Any,
+        allowed: Optional[Tuple[Any, ...]] = None,
+    ) -> bool:
+        """Targeted status transition without a caller-side fetch/save.
+
+        Mutates the stored entity in place and refreshes its index
+        entries. Returns False when the entity is missing, has no
+        status, or its current status is not in `allowed`.
+        """
+        key = str(entity_id)
+        entity = self._storage.get(key)
+        if entity is None or getattr(entity, "status", None) is None:
+            return False
+        if allowed is not None and entity.status not in allowed:
+            return False
+        entity.status = new_status
+        if hasattr(entity, "updated_at"):
+            entity.updated_at = datetime.utcnow()
+        self._unindex_entity(key)
+        self._index_entity(key, entity)
+        return True
+
+    async def get_status_counts(self) -> Dict[str, int]:
+        """Status -> count aggregate, served straight from the status index."""
+        return {
+            value: len(keys)
+            for (attr, value), keys in self._indexes.items()
+            if attr == "status" and keys
+        }
+
+    async def stats_snapshot(self) -> Dict[str, Any]:
+        """Aggregate counts by status, priority and agent.
+
+        Served from the secondary index bucket sizes: one walk over the
+        distinct buckets rather than one over every stored entity, so
+        the cost stays flat no matter how many tasks accumulate.
+        Priority keys are reported as the enum names callers expect.
+        """
+        by_status: Dict[str, int] = {}
+        by_priority: Dict[str, int] = {}
+        by_agent: Dict[str, int] = {}
+        for (attr, value), keys in self._indexes.items():
+            if not keys:
+                continue
+            if attr == "status":
+                by_status[value] = len(keys)
+            elif attr == "priority":
+                by_priority[value.upper()] = len(keys)
+            elif attr == "agent_id":
+                by_agent[value] = len(keys)
+        return {
+            "total": len(self._storage),
+            "by_status": by_status,
+            "by_priority": by_priority,
+            "by_agent": by_agent,
+        }
+
 
 class RedisRepository(Repository):
     """Redis-based repository for production use."""
 
-    def __init__(self, redis_url: str = "redis://localhost:6379", key_prefix: str = "prometheus"):
+    # Entity attributes mirrored into Redis SETs on save; criteria on
+    # these resolve via SINTER instead of a full keyspace scan.
+    _INDEXED_ATTRS = ("agent_id", "status", "priority")
+    # SCAN batch size: large enough to keep round trips rare, small
+    # enough not to stall the Redis event loop per call.
+    _SCAN_COUNT = 500
+    # Entity-type segments probed when a lookup doesn't say which kind
+    # of entity an id belongs to.
+    _ENTITY_TYPE_PROBES = ("task", "agent", "message")
+    # Key segments holding index SETs and stats hashes rather than
+    # serialized entities; a keyspace scan must not GET these.
+    _NON_ENTITY_SEGMENTS = frozenset({"idx", "stats"})
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379",
+        key_prefix: str = "prometheus",
+        serializer: str = "msgpack",
+        redis_client: Optional[redis.Redis] = None,
+    ):
         self.redis_url = redis_url
         self.key_prefix = key_prefix
-        self._redis_client: Optional[redis.Redis] = None
+        # "msgpack" (default) for compact binary storage; "json" keeps
+        # values readable in redis-cli for debugging.
+        self._serializer = serializer
+        self._redis_client = redis_client
+        # Static key prefixes UTF-8 encoded once; passing bytes keys
+        # spares the client its per-command re-encode.
+        self._type_key_prefixes: Dict[str, bytes] = {
+            probe: f"{key_prefix}:{probe}:".encode()
+            for probe in self._ENTITY_TYPE_PROBES
+        }
+
+    def _entity_key(self, entity_type: str, entity_id: Any) -> bytes:
+        """Full storage key for an entity, as bytes."""
+        prefix = self._type_key_prefixes.get(entity_type)
+        if prefix is None:
+            prefix = f"{self.key_prefix}:{entity_type}:".encode()
+        return prefix + str(entity_id).encode()
+
+    def _dumps(self, data: Dict[str, Any]) -> bytes:
+        """Encode an entity dict in the configured storage format."""
+        if self._serializer == "msgpack":
+            return msgpack.packb(data, use_bin_type=True)
+        return orjson.dumps(data)
+
+    def _loads(self, raw: bytes) -> Dict[str, Any]:
+        """Decode a stored value in the configured storage format."""
+        if self._serializer == "msgpack":
+            return msgpack.unpackb(raw, raw=False)
+        return orjson.loads(raw)
 
     async def connect(self) -> None:
         """Connect to Redis."""
-        self._redis_client = redis.from_url(self.redis_url)
+        if self._redis_client is None:
+            self._redis_client = get_redis_client(self.redis_url)
         await self._redis_client.ping()
         logger.info("Connected to Redis repository")
 
@@ -87,122 +308,249 @@ class RedisRepository(Repository):
             await self._redis_client.close()
         logger.info("Disconnected from Redis repository")
 
+    def _index_set_key(self, attr: str, value: Any) -> str:
+        """Key of the index SET holding entity keys with attr == value."""
+        return f"{self.key_prefix}:idx:{attr}:{value}"
+
+    def _entity_type_from_key(self, key: bytes) -> str:
+        """Extract the entity-type segment following the key prefix."""
+        return key.decode("utf-8")[len(self.key_prefix) + 1:].split(":", 1)[0]
+
+    def _queue_entity_write(self, pipe, entity: Any, entity_data: Dict[str, Any]) -> None:
+        """Queue the entity SET plus its index SADDs on a pipeline."""
+        key = self._entity_key(type(entity).__name__.lower(), entity.id)
+        pipe.set(key, self._dumps(entity_data))
+        for attr in self._INDEXED_ATTRS:
+            value = getattr(entity, attr, None)
+            if value is not None:
+                pipe.sadd(self._index_set_key(attr, _queryable_value(attr, value)), key)
+
+    def _matches(self, entity: Any, criteria: Dict[str, Any]) -> bool:
+        """Check an entity against criteria, normalizing indexed attrs."""
+        for attr, value in criteria.items():
+            if attr in self._INDEXED_ATTRS:
+                actual = getattr(entity, attr, None)
+                if actual is None or _queryable_value(attr, actual) != _queryable_value(attr, value):
+                    return False
+            elif not hasattr(entity, attr) or getattr(entity, attr) != value:
+                return False
+        return True
+
     async def save(self, entity: Any) -> None:
         """Save entity to Redis."""
         if not self._redis_client:
             await self.connect()
 
         if hasattr(entity, 'id'):
-            key = f"{self.key_prefix}:{type(entity).__name__.lower()}:{entity.id}"
-            
-            # Serialize entity
             entity_data = await self._serialize_entity(entity)
-            
-            await self._redis_client.set(key, json.dumps(entity_data))
+            # Entity write and index updates share one pipeline, so the
+            # indexes cost no extra round trip.
+            pipe = self._redis_client.pipeline(transaction=False)
+            self._queue_entity_write(pipe, entity, entity_data)
+            await pipe.execute()
             logger.debug("Entity saved to Redis repository", entity_id=str(entity.id))
         else:
             raise ValueError("Entity must have an 'id' attribute")
 
-    async def get_by_id(self, entity_id: Union[AgentId, TaskId, UUID]) -> Optional[Any]:
-        """Get entity by ID from Redis."""
+    async def save_many(self, entities: List[Any]) -> None:
+        """Save a batch of entities in one pipelined round trip."""
+        if not entities:
+            return
         if not self._redis_client:
             await self.connect()
 
-        # Try different entity types
-        for entity_type in ["task", "agent", "message"]:
-            key = f"{self.key_prefix}:{entity_type}:{entity_id}"
-            data = await self._redis_client.get(key)
+        pipe = self._redis_client.pipeline(transaction=False)
+        for entity in entities:
+            self._queue_entity_write(pipe, entity, await self._serialize_entity(entity))
+        await pipe.execute()
+        logger.debug("Entities saved to Redis repository", count=len(entities))
+
+    async def get_by_id(
+        self,
+        entity_id: Union[AgentId, TaskId, UUID],
+        entity_type: Optional[str] = None,
+    ) -> Optional[Any]:
+        """Get entity by ID from Redis.
+
+        Callers that know the entity type pass it to hit the key
+        directly; otherwise all type probes go out in one pipelined
+        round trip instead of up to three sequential GETs.
+        """
+        if not self._redis_client:
+            await self.connect()
+
+        if entity_type is not None:
+            probes = (entity_type,)
+            values = [await self._redis_client.get(self._entity_key(entity_type, entity_id))]
+        else:
+            probes = self._ENTITY_TYPE_PROBES
+            pipe = self._redis_client.pipeline(transaction=False)
+            for probe in probes:
+                pipe.get(self._entity_key(probe, entity_id))
+            values = await pipe.execute()
+
+        for probe, data in zip(probes, values):
             if data:
-                entity_data = json.loads(data)
-                entity = await self._deserialize_entity(entity_data, entity_type)
+                entity = await self._deserialize_entity(self._loads(data), probe)
                 logger.debug("Entity retrieved from Redis repository", entity_id=str(entity_id))
                 return entity
         
         return None
 
-    async def list_all(self) -> List[Any]:
-        """List all entities from Redis."""
+    async def list_all(self, offset: int = 0, limit: Optional[int] = None) -> List[Any]:
+        """List entities from Redis, fetching only the requested page."""
         if not self._redis_client:
             await self.connect()
 
+        # Cursor-based SCAN instead of KEYS, which is O(N) and blocks
+        # the Redis event loop for the whole keyspace walk. SCAN yields
+        # keys in no stable order, so the full key set is collected and
+        # sorted before slicing — otherwise consecutive pages could
+        # repeat or skip entities — but only the requested page's
+        # values are fetched.
         pattern = f"{self.key_prefix}:*"
-        keys = await self._redis_client.keys(pattern)
-        
-        entities = []
+        stop = None if limit is None else offset + limit
+        keys = []
+        async for key in self._redis_client.scan_iter(match=pattern, count=self._SCAN_COUNT):
+            if self._entity_type_from_key(key) in self._NON_ENTITY_SEGMENTS:
+                continue
+            keys.append(key)
+        keys.sort()
+        if offset or stop is not None:
+            keys = keys[offset:stop]
+
+        # Fetch the values in one pipelined round trip instead of one
+        # GET per key.
+        pipe = self._redis_client.pipeline(transaction=False)
         for key in keys:
-            data = await self._redis_client.get(key)
+            pipe.get(key)
+        values = await pipe.execute()
+
+        entities = []
+        for key, data in zip(keys, values):
             if data:
-                entity_data = json.loads(data)
-                # Extract entity type from key
-                key_parts = key.decode("utf-8").split(":")
-                if len(key_parts) >= 2:
-                    entity_type = key_parts[1]
-                    entity = await self._deserialize_entity(entity_data, entity_type)
-                    if entity:
-                        entities.append(entity)
+                entity_data = self._loads(data)
+                entity = await self._deserialize_entity(entity_data, self._entity_type_from_key(key))
+                if entity:
+                    entities.append(entity)
         
         logger.debug("Listed all entities from Redis repository", count=len(entities))
         return entities
 
-    async def delete(self, entity_id: Union[AgentId, TaskId, UUID]) -> bool:
-        """Delete entity by ID from Redis."""
+    async def delete(
+        self,
+        entity_id: Union[AgentId, TaskId, UUID],
+        entity_type: Optional[str] = None,
+    ) -> bool:
+        """Delete entity by ID from Redis.
+
+        An id lives under exactly one type segment, so when the type is
+        unknown all candidate keys go into one varargs DEL — a single
+        command rather than a pipeline of three.
+        """
         if not self._redis_client:
             await self.connect()
 
-        # Try different entity types
-        for entity_type in ["task", "agent", "message"]:
-            key = f"{self.key_prefix}:{entity_type}:{entity_id}"
-            result = await self._redis_client.delete(key)
-            if result:
-                logger.debug("Entity deleted from Redis repository", entity_id=str(entity_id))
-                return True
+        if entity_type is not None:
+            keys = (self._entity_key(entity_type, entity_id),)
+        else:
+            keys = tuple(self._entity_key(probe, entity_id) for probe in self._ENTITY_TYPE_PROBES)
+        deleted = await self._redis_client.delete(*keys)
+
+        if deleted:
+            logger.debug("Entity deleted from Redis repository", entity_id=str(entity_id))
+            return True
         
         return False
 
-    async def find_by_criteria(self, criteria: Dict[str, Any]) -> List[Any]:
-        """Find entities by criteria in Redis."""
-        # For simplicity, get all entities and filter
-        # In production, consider using Redis search or secondary indexes
-        all_entities = await self.list_all()
-        
+    async def find_by_criteria(
+        self,
+        criteria: Dict[str, Any],
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Any]:
+        """Find entities by criteria in Redis.
+
+        Indexed criteria resolve via SINTER over the index SETs, then one
+        pipelined fetch of the matching keys — sliced to the requested
+        page first, so deep result sets don't all cross the wire. Index
+        membership can lag an overwrite that changed an indexed
+        attribute, so fetched entities are re-checked and stale members
+        pruned lazily (which can leave a page slightly short). Criteria
+        without an indexed attribute fall back to scanning all entities.
+        """
+        if not self._redis_client:
+            await self.connect()
+
+        indexed = {k: v for k, v in criteria.items() if k in self._INDEXED_ATTRS}
+        stop = None if limit is None else offset + limit
+
+        if not indexed:
+            all_entities = await self.list_all()
+            matches = (entity for entity in all_entities if self._matches(entity, criteria))
+            results = list(islice(matches, offset, stop))
+            logger.debug("Found entities by criteria in Redis", criteria=criteria, count=len(results))
+            return results
+
+        index_keys = [
+            self._index_set_key(attr, _queryable_value(attr, value))
+            for attr, value in indexed.items()
+        ]
+        # SINTER yields members in arbitrary order; sort before slicing
+        # so consecutive pages neither repeat nor skip entities.
+        keys = sorted(await self._redis_client.sinter(*index_keys))[offset:stop]
+        if not keys:
+            return []
+
+        pipe = self._redis_client.pipeline(transaction=False)
+        for key in keys:
+            pipe.get(key)
+        values = await pipe.execute()
+
         results = []
-        for entity in all_entities:
-            match = True
-            for key, value in criteria.items():
-                if not hasattr(entity, key) or getattr(entity, key) != value:
-                    match = False
-                    break
-            if match:
+        missing = []
+        stale_by_index: Dict[str, List[bytes]] = {}
+        for key, data in zip(keys, values):
+            if not data:
+                # The entity itself is gone; no queried set should keep it.
+                missing.append(key)
+                continue
+            entity = await self._deserialize_entity(self._loads(data), self._entity_type_from_key(key))
+            if entity is None:
+                continue
+            if self._matches(entity, criteria):
                 results.append(entity)
-        
+                continue
+            # save() only SADDs current index values and never SREMs old
+            # ones, so an entity that fails this query may still be a
+            # legitimate member of the other queried sets. Prune it only
+            # from the sets whose own criterion it no longer satisfies.
+            for (attr, value), index_key in zip(indexed.items(), index_keys):
+                if not self._matches(entity, {attr: value}):
+                    stale_by_index.setdefault(index_key, []).append(key)
+
+        if missing or stale_by_index:
+            cleanup = self._redis_client.pipeline(transaction=False)
+            for index_key in index_keys:
+                members = stale_by_index.get(index_key, []) + missing
+                if members:
+                    cleanup.srem(index_key, *members)
+            await cleanup.execute()
+
         logger.debug("Found entities by criteria in Redis", criteria=criteria, count=len(results))
         return results
 
     async def _serialize_entity(self, entity: Any) -> Dict[str, Any]:
         """Serialize entity for storage."""
-        if isinstance(entity, Task):
-            return {
-                "id": str(entity.id.value),
-                "agent_id": str(entity.agent_id.value),
-                "name": entity.name,
-                "description": entity.description,
-                "priority": entity.priority.value,
-                "status": entity.status.value,
-                "created_at": entity.created_at.isoformat(),
-                "updated_at": entity.updated_at.isoformat(),
-                "completed_at": entity.completed_at.isoformat() if entity.completed_at else None,
-                "result": entity.result,
-                "error": entity.error,
-                "metadata": entity.metadata,
-                "_type": "Task",
-            }
-        else:
-            # Generic serialization for other entities
-            return {
-                "id": str(getattr(entity, 'id', '')),
-                "_type": type(entity).__name__,
-                "data": str(entity),  # Fallback serialization
-            }
+        serializer = _SERIALIZERS.get(type(entity))
+        if serializer is not None:
+            return serializer(entity)
+        # Generic serialization for other entities
+        return {
+            "id": str(getattr(entity, 'id', '')),
+            "_type": type(entity).__name__,
+            "data": str(entity),  # Fallback serialization
+        }
 
     async def _deserialize_entity(self, data: Dict[str, Any], entity_type: str) -> Optional[Any]:
         """Deserialize entity from storage."""
@@ -239,8 +587,201 @@ class RedisRepository(Repository):
 class TaskRepository(RedisRepository):
     """Specialized repository for Task entities."""
 
+    # Coalescing knobs: a flush goes out once this many saves are queued
+    # or once the window elapses, whichever comes first.
+    _FLUSH_BATCH_SIZE = 64
+    _FLUSH_WINDOW_SECONDS = 0.001
+
     def __init__(self, redis_url: str = "redis://localhost:6379"):
         super().__init__(redis_url, "prometheus:tasks")
+        self._pending_saves: List[Tuple[Task, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        # Rollup counters live in Redis hashes updated alongside each
+        # write, so statistics reads are constant-size HGETALLs instead
+        # of pulling every task. The last written (status, priority,
+        # agent) per task is tracked here so a transition moves each
+        # bucket exactly once per writer.
+        self._stats_hash_key = f"{self.key_prefix}:stats"
+        self._rollup_hash_keys = (
+            self._stats_hash_key,
+            f"{self.key_prefix}:stats:priority",
+            f"{self.key_prefix}:stats:agent",
+        )
+        self._rollup_by_id: Dict[str, Tuple[Optional[str], ...]] = {}
+
+    _NO_ROLLUP = (None, None, None)
+
+    async def connect(self) -> None:
+        await super().connect()
+        await self._rebuild_rollup()
+
+    async def _rebuild_rollup(self) -> None:
+        """Recount the rollup hashes from stored tasks on connect.
+
+        The decrement side depends on _rollup_by_id remembering each
+        task's last-written buckets, and that map lives in process
+        memory: after a restart it is empty, so re-saving a stored task
+        would increment its new buckets without decrementing the old
+        ones and the counters would drift permanently. Recounting here
+        squares the durable hashes with what is actually stored and
+        reseeds the map so later transitions decrement correctly.
+        """
+        rollup_by_id: Dict[str, Tuple[Optional[str], ...]] = {}
+        counters: Tuple[Dict[str, int], ...] = tuple(
+            defaultdict(int) for _ in self._rollup_hash_keys
+        )
+        for task in await self.list_all():
+            rollup = (
+                task.status.value,
+                getattr(task.priority, "name", None),
+                task.agent_id_str,
+            )
+            rollup_by_id[str(task.id)] = rollup
+            for counter, bucket in zip(counters, rollup):
+                if bucket is not None:
+                    counter[bucket] += 1
+
+        pipe = self._redis_client.pipeline(transaction=False)
+        pipe.delete(*self._rollup_hash_keys)
+        for hash_key, counter in zip(self._rollup_hash_keys, counters):
+            if counter:
+                pipe.hset(hash_key, mapping=dict(counter))
+        await pipe.execute()
+        self._rollup_by_id = rollup_by_id
+
+    def _queue_entity_write(self, pipe, entity: Any, entity_data: Dict[str, Any]) -> None:
+        super()._queue_entity_write(pipe, entity, entity_data)
+        rollup = (
+            entity_data.get("status"),
+            getattr(entity.priority, "name", None),
+            entity_data.get("agent_id"),
+        )
+        key = entity_data.get("id") or str(entity.id)
+        old = self._rollup_by_id.get(key)
+        if old != rollup:
+            for hash_key, old_field, new_field in zip(
+                self._rollup_hash_keys, old or self._NO_ROLLUP, rollup
+            ):
+                if old_field != new_field:
+                    if old_field is not None:
+                        pipe.hincrby(hash_key, old_field, -1)
+                    if new_field is not None:
+                        pipe.hincrby(hash_key, new_field, 1)
+            self._rollup_by_id[key] = rollup
+
+    async def delete(self, entity_id, entity_type: Optional[str] = None) -> bool:
+        deleted = await super().delete(entity_id, entity_type)
+        if deleted:
+            rollup = self._rollup_by_id.pop(str(entity_id), None)
+            if rollup is not None:
+                pipe = self._redis_client.pipeline(transaction=False)
+                for hash_key, field in zip(self._rollup_hash_keys, rollup):
+                    if field is not None:
+                        pipe.hincrby(hash_key, field, -1)
+                await pipe.execute()
+        return deleted
+
+    @staticmethod
+    def _decode_counts(raw: Dict[Any, Any]) -> Dict[str, int]:
+        """Decode an HGETALL result into a str -> int count mapping.
+
+        Buckets decremented back to zero stay in the hash; they are
+        dropped here so emptied statuses don't linger in reports.
+        """
+        return {
+            (field.decode("utf-8") if isinstance(field, bytes) else field): count
+            for field, value in raw.items()
+            if (count := int(value))
+        }
+
+    async def get_status_counts(self) -> Dict[str, int]:
+        """Status -> count aggregate from the maintained Redis hash."""
+        if not self._redis_client:
+            await self.connect()
+        return self._decode_counts(await self._redis_client.hgetall(self._stats_hash_key))
+
+    async def stats_snapshot(self) -> Dict[str, Any]:
+        """Aggregate counts by status, priority and agent.
+
+        Reads the incrementally maintained rollup hashes in one
+        pipelined round trip — statistics never list the tasks.
+        """
+        if not self._redis_client:
+            await self.connect()
+        pipe = self._redis_client.pipeline(transaction=False)
+        for hash_key in self._rollup_hash_keys:
+            pipe.hgetall(hash_key)
+        status_raw, priority_raw, agent_raw = await pipe.execute()
+        by_status = self._decode_counts(status_raw)
+        return {
+            "total": sum(by_status.values()),
+            "by_status": by_status,
+            "by_priority": self._decode_counts(priority_raw),
+            "by_agent": self._decode_counts(agent_raw),
+        }
+
+    async def save_batched(self, task: Task) -> None:
+        """Save a task through the write coalescer.
+
+        Concurrent saves within the flush window are collapsed into a
+        single Redis pipeline, one round trip for the whole batch instead
+        of one per task. Resolves once the task has reached Redis.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending_saves.append((task, future))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_pending_saves())
+        await future
+
+    async def _flush_pending_saves(self) -> None:
+        """Drain queued saves into pipelined writes until the queue empties."""
+        while self._pending_saves:
+            if len(self._pending_saves) < self._FLUSH_BATCH_SIZE:
+                # Give concurrent writers the window to join this batch.
+                await asyncio.sleep(self._FLUSH_WINDOW_SECONDS)
+            batch = self._pending_saves[:self._FLUSH_BATCH_SIZE]
+            del self._pending_saves[:len(batch)]
+
+            try:
+                if not self._redis_client:
+                    await self.connect()
+                pipe = self._redis_client.pipeline(transaction=False)
+                for task, _ in batch:
+                    entity_data = await self._serialize_entity(task)
+                    self._queue_entity_write(pipe, task, entity_data)
+                await pipe.execute()
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(None)
+            logger.debug("Flushed batched task saves", count=len(batch))
+
+    async def update_status(
+        self,
+        entity_id: Union[TaskId, UUID],
+        new_status: Any,
+        allowed: Optional[Tuple[Any, ...]] = None,
+    ) -> bool:
+        """Targeted status transition on a stored task.
+
+        Tasks are stored as one serialized blob, so the value has to be
+        rewritten either way; this keeps the read typed (no probe
+        pipeline) and the write on the coalesced save path, with the
+        status guard applied repository-side.
+        """
+        task = await self.get_by_id(entity_id, "task")
+        if task is None:
+            return False
+        if allowed is not None and task.status not in allowed:
+            return False
+        task.status = new_status
+        task.touch()
+        await self.save_batched(task)
+        return True
 
     async def find_by_agent(self, agent_id: AgentId) -> List[Task]:
         """Find tasks by agent ID."""
@@ -2,12 +2,16 @@
 Agent Manager Service for Project Prometheus.
 Manages the lifecycle and coordination of all agents in the system.
 """
-from typing import Any, Dict, List, Optional
+import asyncio
+from collections import defaultdict
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 from uuid import UUID
 
 import structlog
 
-from ..core.domain import AgentId, AgentType, EventBus, Repository
+from ..core.domain import AgentId, AgentType, EventBus, Message, Repository
 from ..core.base_agent import BaseAgent
 from ..agents import (
     AgentPrometheus,
@@ -21,6 +25,16 @@ from ..infrastructure.repositories import InMemoryRepository, TaskRepository
 
 logger = structlog.get_logger()
 
+# Built once at import and frozen: create_agent previously rebuilt this
+# five-entry dict on every call.
+_AGENT_CLASSES: Mapping[AgentType, type] = MappingProxyType({
+    AgentType.PROMETHEUS: AgentPrometheus,
+    AgentType.DAEDALUS: AgentDaedalus,
+    AgentType.LOGOS: AgentLogos,
+    AgentType.ODYSSEUS: AgentOdysseus,
+    AgentType.THEMIS: AgentThemis,
+})
+
 
 class AgentManager:
     """
@@ -41,13 +55,33 @@ class AgentManager:
         use_redis: bool = False,
     ):
         self._agents: Dict[str, BaseAgent] = {}
+        # Secondary index keyed by AgentType value, maintained by
+        # create_agent/remove_agent, so type lookups skip the O(N) scan.
+        self._agents_by_type: Dict[str, List[BaseAgent]] = defaultdict(list)
         self._event_bus = event_bus or (
             RedisEventBus() if use_redis else InMemoryEventBus()
         )
         self._task_repository = task_repository or (
             TaskRepository() if use_redis else InMemoryRepository()
         )
+        # Maintained incrementally by create_agent, setup_agent_hierarchy
+        # and _remove_from_hierarchy rather than rebuilt wholesale.
         self._agent_hierarchy: Dict[str, List[str]] = {}
+        # Reverse index: child id string -> (supervisor id string, child
+        # AgentId), so detaching an agent is one dict pop instead of a
+        # scan over every agent's subordinate set.
+        self._supervisor_of: Dict[str, Tuple[str, AgentId]] = {}
+        # Optional infrastructure capabilities probed once at wire-up;
+        # call sites branch on the bound method (None when absent)
+        # instead of paying a hasattr per invocation.
+        self._bus_connect = getattr(self._event_bus, 'connect', None)
+        self._bus_disconnect = getattr(self._event_bus, 'disconnect', None)
+        self._bus_broadcast = getattr(self._event_bus, 'broadcast', None)
+        self._repo_connect = getattr(self._task_repository, 'connect', None)
+        self._repo_disconnect = getattr(self._task_repository, 'disconnect', None)
+        self._repo_status_counts = getattr(self._task_repository, 'get_status_counts', None)
+        self._bus_ping = getattr(self._event_bus, 'ping', None)
+        self._warmup_task: Optional[asyncio.Task] = None
         self._running = False
 
     async def start(self) -> None:
@@ -55,29 +89,57 @@ class AgentManager:
         self._running = True
         
         # Connect event bus if needed
-        if hasattr(self._event_bus, 'connect'):
-            await self._event_bus.connect()
+        if self._bus_connect:
+            await self._bus_connect()
         
         # Connect repository if needed
-        if hasattr(self._task_repository, 'connect'):
-            await self._task_repository.connect()
+        if self._repo_connect:
+            await self._repo_connect()
+        
+        # Warm the connection pool in the background so the first
+        # publish or read hits a live socket instead of paying TCP and
+        # auth setup inline on a request (or halt) path.
+        if self._bus_ping:
+            self._warmup_task = asyncio.create_task(self._warm_up_connections())
         
         logger.info("Agent manager started")
 
+    # Connections opened ahead of first use by the warm-up task.
+    _WARMUP_CONNECTIONS = 4
+
+    async def _warm_up_connections(self) -> None:
+        """Open a few pooled connections ahead of first use."""
+        try:
+            await asyncio.gather(
+                *(self._bus_ping() for _ in range(self._WARMUP_CONNECTIONS))
+            )
+        except Exception as e:
+            logger.debug("Connection warm-up skipped", error=str(e))
+
     async def stop(self) -> None:
         """Stop the agent manager and all agents."""
         self._running = False
         
-        # Stop all agents
-        for agent in self._agents.values():
-            await agent.stop()
+        if self._warmup_task:
+            self._warmup_task.cancel()
+            self._warmup_task = None
+        
+        # Stop all agents concurrently: each stop blocks on independent
+        # I/O, so wall time becomes the slowest agent, not the sum.
+        agents = list(self._agents.values())
+        results = await asyncio.gather(
+            *(agent.stop() for agent in agents), return_exceptions=True
+        )
+        for agent, result in zip(agents, results):
+            if isinstance(result, Exception):
+                logger.error("Error stopping agent", agent_id=agent.id_str, error=str(result))
         
         # Disconnect infrastructure
-        if hasattr(self._event_bus, 'disconnect'):
-            await self._event_bus.disconnect()
+        if self._bus_disconnect:
+            await self._bus_disconnect()
         
-        if hasattr(self._task_repository, 'disconnect'):
-            await self._task_repository.disconnect()
+        if self._repo_disconnect:
+            await self._repo_disconnect()
         
         logger.info("Agent manager stopped")
 
@@ -90,42 +152,54 @@ class AgentManager:
         config = config or {}
         
         # Create agent based on type
-        agent_classes = {
-            AgentType.PROMETHEUS: AgentPrometheus,
-            AgentType.DAEDALUS: AgentDaedalus,
-            AgentType.LOGOS: AgentLogos,
-            AgentType.ODYSSEUS: AgentOdysseus,
-            AgentType.THEMIS: AgentThemis,
-        }
-        
-        if agent_type not in agent_classes:
+        agent_class = _AGENT_CLASSES.get(agent_type)
+        if agent_class is None:
             raise ValueError(f"Unknown agent type: {agent_type}")
         
-        agent_class = agent_classes[agent_type]
         agent = agent_class(
             event_bus=self._event_bus,
             task_repository=self._task_repository,
         )
         
         # Store agent
-        self._agents[str(agent.id)] = agent
+        self._agents[agent.id_str] = agent
+        self._agents_by_type[agent_type.value].append(agent)
+        self._agent_hierarchy[agent.id_str] = []
         
         # Start agent
         await agent.start()
         
-        logger.info("Agent created", agent_id=str(agent.id), agent_type=str(agent_type))
+        logger.info("Agent created", agent_id=agent.id_str, agent_type=str(agent_type))
         return agent
 
     async def get_agent(self, agent_id: str) -> Optional[BaseAgent]:
         """Get agent by ID."""
         return self._agents.get(agent_id)
 
+    async def get_agent_by_uuid(self, agent_id: AgentId) -> Optional[BaseAgent]:
+        """Get agent by its AgentId value object.
+
+        Callers holding an AgentId (e.g. task.agent_id) skip building a
+        fresh string: AgentId caches its render, so this is a slot read
+        plus one registry lookup.
+        """
+        return self._agents.get(str(agent_id))
+
     async def get_agent_by_type(self, agent_type: str) -> Optional[BaseAgent]:
         """Get first agent of specified type."""
-        for agent in self._agents.values():
-            if str(agent.type).lower() == agent_type.lower():
-                return agent
-        return None
+        agents = self._agents_by_type.get(agent_type.lower())
+        return agents[0] if agents else None
+
+    async def get_agents_by_types(self, agent_types) -> Dict[str, Optional[BaseAgent]]:
+        """Resolve several agent types in one call.
+
+        Batch counterpart of get_agent_by_type for callers that would
+        otherwise await a lookup per item in a loop.
+        """
+        return {
+            agent_type: (agents[0] if (agents := self._agents_by_type.get(agent_type.lower())) else None)
+            for agent_type in agent_types
+        }
 
     async def remove_agent(self, agent_id: str) -> bool:
         """Remove agent from the system."""
@@ -135,6 +209,10 @@ class AgentManager:
         agent = self._agents[agent_id]
         await agent.stop()
         del self._agents[agent_id]
+        if agent.type:
+            agents_of_type = self._agents_by_type.get(agent.type.value)
+            if agents_of_type and agent in agents_of_type:
+                agents_of_type.remove(agent)
         
         # Remove from hierarchy
         self._remove_from_hierarchy(agent_id)
@@ -164,24 +242,23 @@ class AgentManager:
 
     async def list_agents(self) -> List[Dict[str, Any]]:
         """List all agents with their status."""
-        agents_info = []
-        
-        for agent in self._agents.values():
-            status = await agent.get_status()
-            agents_info.append(status)
-        
-        return agents_info
+        return list(await asyncio.gather(
+            *(agent.get_status() for agent in self._agents.values())
+        ))
 
     async def setup_agent_hierarchy(self) -> Dict[str, Any]:
         """Setup the standard Project Prometheus agent hierarchy."""
-        hierarchy_info = {"created_agents": [], "relationships": {}}
+        # defaultdict gives relationship inserts a single lookup+append;
+        # converted back to a plain dict on return.
+        relationships: Dict[str, List[str]] = defaultdict(list)
+        hierarchy_info = {"created_agents": [], "relationships": relationships}
         
         # Create Prometheus (master) if not exists
         prometheus_agent = await self.get_agent_by_type("prometheus")
         if not prometheus_agent:
             prometheus_agent = await self.create_agent(AgentType.PROMETHEUS)
             hierarchy_info["created_agents"].append({
-                "id": str(prometheus_agent.id),
+                "id": prometheus_agent.id_str,
                 "type": "prometheus",
                 "role": "master"
             })
@@ -193,23 +270,31 @@ class AgentManager:
             (AgentType.THEMIS, "safety_overseer"),
         ]
         
-        for agent_type, role in subordinate_types:
-            existing_agent = await self.get_agent_by_type(agent_type.value)
-            if not existing_agent:
-                agent = await self.create_agent(agent_type)
-                hierarchy_info["created_agents"].append({
-                    "id": str(agent.id),
-                    "type": agent_type.value,
-                    "role": role
-                })
-                
-                # Set hierarchy relationships
-                prometheus_agent.add_subordinate(agent.id)
-                agent.set_supervisor(prometheus_agent.id)
-                
-                if str(prometheus_agent.id) not in hierarchy_info["relationships"]:
-                    hierarchy_info["relationships"][str(prometheus_agent.id)] = []
-                hierarchy_info["relationships"][str(prometheus_agent.id)].append(str(agent.id))
+        # Siblings have no ordering dependency, so the missing ones are
+        # created in one concurrent burst — each create_agent awaits the
+        # agent's start (bus/repo round trips) — instead of serially.
+        missing = [
+            (agent_type, role)
+            for agent_type, role in subordinate_types
+            if not await self.get_agent_by_type(agent_type.value)
+        ]
+        created = await asyncio.gather(
+            *(self.create_agent(agent_type) for agent_type, _ in missing)
+        )
+        for (agent_type, role), agent in zip(missing, created):
+            hierarchy_info["created_agents"].append({
+                "id": agent.id_str,
+                "type": agent_type.value,
+                "role": role
+            })
+            
+            # Set hierarchy relationships (in-memory, no await needed)
+            prometheus_agent.add_subordinate(agent.id)
+            agent.set_supervisor(prometheus_agent.id)
+            self._supervisor_of[agent.id_str] = (prometheus_agent.id_str, agent.id)
+            self._agent_hierarchy.setdefault(prometheus_agent.id_str, []).append(agent.id_str)
+            
+            relationships[prometheus_agent.id_str].append(agent.id_str)
         
         # Create Logos as subordinate to Daedalus
         logos_agent = await self.get_agent_by_type("logos")
@@ -218,7 +303,7 @@ class AgentManager:
         if not logos_agent and daedalus_agent:
             logos_agent = await self.create_agent(AgentType.LOGOS)
             hierarchy_info["created_agents"].append({
-                "id": str(logos_agent.id),
+                "id": logos_agent.id_str,
                 "type": "logos",
                 "role": "symbolic_reasoner"
             })
@@ -226,16 +311,15 @@ class AgentManager:
             # Set hierarchy relationships
             daedalus_agent.add_subordinate(logos_agent.id)
             logos_agent.set_supervisor(daedalus_agent.id)
+            self._supervisor_of[logos_agent.id_str] = (daedalus_agent.id_str, logos_agent.id)
+            self._agent_hierarchy.setdefault(daedalus_agent.id_str, []).append(logos_agent.id_str)
             
-            if str(daedalus_agent.id) not in hierarchy_info["relationships"]:
-                hierarchy_info["relationships"][str(daedalus_agent.id)] = []
-            hierarchy_info["relationships"][str(daedalus_agent.id)].append(str(logos_agent.id))
-        
-        self._build_hierarchy_cache()
+            relationships[daedalus_agent.id_str].append(logos_agent.id_str)
         
-        logger.info("Agent hierarchy setup completed", 
+        logger.info("Agent hierarchy setup completed",
                    created_agents=len(hierarchy_info["created_agents"]))
-        
+
+        hierarchy_info["relationships"] = dict(relationships)
         return hierarchy_info
 
     async def get_prometheus_agent(self) -> Optional[BaseAgent]:
@@ -252,11 +336,11 @@ class AgentManager:
         
         for agent in self._agents.values():
             agent_info = {
-                "id": str(agent.id),
-                "type": str(agent.type).lower() if agent.type else "unknown",
+                "id": agent.id_str,
+                "type": agent.type.value if agent.type else "unknown",
                 "active": agent.is_active,
-                "subordinates": [str(sub_id) for sub_id in agent.subordinates],
-                "supervisor": str(agent.supervisor) if agent.supervisor else None,
+                "subordinates": list(agent.subordinate_id_strs),
+                "supervisor": agent.supervisor_str,
             }
             
             if not agent.supervisor:  # Master level
@@ -269,24 +353,34 @@ class AgentManager:
         return hierarchy
 
     async def send_message(
-        self, 
-        sender_id: str, 
-        receiver_id: str, 
+        self,
+        sender_id: str,
+        receiver_id: Union[str, UUID],
         content: Dict[str, Any],
         message_type: str = "general"
     ) -> bool:
-        """Send message between agents."""
+        """Send message between agents.
+
+        The HTTP edge already parses the receiver into a UUID; accepting
+        it here avoids the str round trip and re-parse per send. String
+        ids remain accepted for internal callers, resolved through the
+        registry's stored AgentId where possible.
+        """
         sender = self._agents.get(sender_id)
         if not sender:
             return False
-        
+
         try:
-            receiver_agent_id = AgentId(UUID(receiver_id))
+            if isinstance(receiver_id, UUID):
+                receiver_agent_id = AgentId(receiver_id)
+            else:
+                receiver = self._agents.get(receiver_id)
+                receiver_agent_id = receiver.id if receiver else AgentId(UUID(receiver_id))
             await sender.send_message(receiver_agent_id, content, message_type)
             return True
         except Exception as e:
-            logger.error("Error sending message", error=str(e), 
-                        sender=sender_id, receiver=receiver_id)
+            logger.error("Error sending message", error=str(e),
+                        sender=sender_id, receiver=str(receiver_id))
             return False
 
     async def broadcast_message(
@@ -295,51 +389,70 @@ class AgentManager:
         content: Dict[str, Any],
         message_type: str = "broadcast"
     ) -> int:
-        """Broadcast message to all agents."""
+        """Broadcast message to all agents.
+
+        One publish on the bus's broadcast channel replaces the previous
+        per-recipient send loop (one id parse and round trip per agent);
+        delivery fans out on the subscriber side.
+        """
         sender = self._agents.get(sender_id)
         if not sender:
             return 0
         
-        success_count = 0
-        for agent_id in self._agents.keys():
-            if agent_id != sender_id:
-                success = await self.send_message(sender_id, agent_id, content, message_type)
-                if success:
-                    success_count += 1
-        
-        return success_count
+        try:
+            message = Message(
+                # The registry already holds the sender's AgentId; reuse
+                # it rather than re-parsing the string key.
+                sender_id=sender.id,
+                content=content,
+                message_type=message_type,
+            )
+            await self._event_bus.broadcast(message)
+            # dict_keys supports set ops: the recipient count is every
+            # agent except the sender, with no per-agent branch.
+            return len(self._agents.keys() - {sender_id})
+        except Exception as e:
+            logger.error("Error broadcasting message", error=str(e), sender=sender_id)
+            return 0
 
     async def emergency_halt(self, reason: str = "Emergency halt") -> None:
         """Emergency halt all system operations."""
         logger.critical("EMERGENCY HALT INITIATED", reason=reason)
         
-        # Stop all agents immediately
-        for agent in self._agents.values():
-            try:
-                await agent.stop()
-            except Exception as e:
+        # Stop all agents immediately and concurrently, so one agent
+        # blocked on a slow disconnect cannot delay halting the rest.
+        agents = list(self._agents.values())
+        results = await asyncio.gather(
+            *(agent.stop() for agent in agents), return_exceptions=True
+        )
+        for agent, result in zip(agents, results):
+            if isinstance(result, Exception):
                 logger.error("Error stopping agent during emergency halt", 
-                           agent_id=str(agent.id), error=str(e))
+                           agent_id=agent.id_str, error=str(result))
         
-        # Notify all agents of emergency halt
+        # Notify all agents of emergency halt. The timestamp renders once
+        # and the dict is shared by reference across every envelope, so
+        # the fan-out pays one format call and one allocation total.
         halt_message = {
             "type": "emergency_halt",
             "reason": reason,
-            "timestamp": "2024-01-01T00:00:00Z",
+            "timestamp": datetime.now(timezone.utc).isoformat(
+                timespec="milliseconds"
+            ).replace("+00:00", "Z"),
         }
         
-        # Send via event bus if available
+        # Send via event bus if available. Halt is latency-sensitive:
+        # one message on the broadcast channel reaches every subscriber,
+        # so the cost is a single serialization and round trip no matter
+        # how many agents are running.
         try:
-            if hasattr(self._event_bus, 'publish'):
-                from ..core.domain import Message, AgentId
-                for agent_id in self._agents.keys():
-                    emergency_msg = Message(
-                        sender_id=AgentId(),  # System message
-                        receiver_id=AgentId(UUID(agent_id)),
-                        content=halt_message,
-                        message_type="emergency_halt"
-                    )
-                    await self._event_bus.publish(emergency_msg)
+            if self._bus_broadcast:
+                emergency_msg = Message(
+                    sender_id=AgentId(),  # System message
+                    content=halt_message,
+                    message_type="emergency_halt"
+                )
+                await self._bus_broadcast(emergency_msg)
         except Exception as e:
             logger.error("Error broadcasting emergency halt", error=str(e))
 
@@ -365,10 +478,14 @@ class AgentManager:
             "cancelled": 0,
         }
         
-        # This is a simplified implementation
-        # In production, you'd query the task repository
         try:
-            if hasattr(self._task_repository, 'find_by_criteria'):
+            if self._repo_status_counts:
+                # Server-side aggregate: constant-size payload instead of
+                # transferring and iterating every task record.
+                for status_value, count in (await self._repo_status_counts()).items():
+                    if status_value in stats:
+                        stats[status_value] = count
+            else:
                 all_tasks = await self._task_repository.list_all()
                 for task in all_tasks:
                     status = getattr(task, 'status', None)
@@ -381,21 +498,19 @@ class AgentManager:
         
         return stats
 
-    def _build_hierarchy_cache(self) -> None:
-        """Build internal hierarchy cache for efficient lookups."""
-        self._agent_hierarchy = {}
-        
-        for agent in self._agents.values():
-            agent_id = str(agent.id)
-            subordinates = [str(sub_id) for sub_id in agent.subordinates]
-            self._agent_hierarchy[agent_id] = subordinates
-
     def _remove_from_hierarchy(self, agent_id: str) -> None:
         """Remove agent from hierarchy relationships."""
-        # Remove as subordinate from other agents
-        for agent in self._agents.values():
-            if agent_id in [str(sub_id) for sub_id in agent.subordinates]:
-                agent.remove_subordinate(AgentId(UUID(agent_id)))
+        # Detach from the supervisor via the reverse index; the stored
+        # AgentId avoids reconstructing one from the string.
+        entry = self._supervisor_of.pop(agent_id, None)
+        if entry:
+            supervisor_id, agent_ref = entry
+            supervisor = self._agents.get(supervisor_id)
+            if supervisor:
+                supervisor.remove_subordinate(agent_ref)
+            cached = self._agent_hierarchy.get(supervisor_id)
+            if cached and agent_id in cached:
+                cached.remove(agent_id)
         
         # Remove from hierarchy cache
         if agent_id in self._agent_hierarchy:
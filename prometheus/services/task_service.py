@@ -2,16 +2,38 @@
 Task Service for Project Prometheus.
 Manages task creation, execution, and lifecycle.
 """
+import asyncio
+import logging
+from collections import Counter, OrderedDict
+from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 import structlog
 
+from ..config.settings import log_level_enabled
 from ..core.domain import AgentId, Priority, Task, TaskId, TaskStatus
 from ..services.agent_manager import AgentManager
 
 logger = structlog.get_logger()
 
+# How long an in-progress task may go without an update before the
+# monitor reports it as stuck.
+_STUCK_TASK_THRESHOLD = timedelta(hours=1)
+
+
+@lru_cache(maxsize=1024)
+def _parse_uuid(value: str) -> UUID:
+    """Parse a UUID string, memoized.
+
+    Service calls arrive with the same handful of task and agent id
+    strings over and over (poll loops, retries, the execute/re-fetch
+    pair), so the pure-Python parse is worth caching. Invalid strings
+    raise and are never cached.
+    """
+    return UUID(value)
+
 
 class TaskService:
     """
@@ -24,9 +46,56 @@ class TaskService:
     - Provide task statistics and reporting
     """
 
+    # Upper bound on cached task lookups; dashboard polling revisits a
+    # small working set of recent tasks, so a modest LRU covers it.
+    _TASK_CACHE_MAX = 128
+
     def __init__(self, agent_manager: AgentManager):
         self._agent_manager = agent_manager
         self._task_repository = agent_manager._task_repository
+        # Live view of the manager's agent registry. Hot task paths look
+        # agents up per call; reading the shared dict directly costs one
+        # lookup, is never stale, and needs no TTL or invalidation.
+        self._agents = agent_manager._agents
+        # Probed once at wire-up, mirroring the manager's capability
+        # bindings: statistics prefer the repository's index-backed
+        # aggregate when it offers one.
+        self._repo_stats_snapshot = getattr(self._task_repository, 'stats_snapshot', None)
+        # Writes go through the repository's coalescing save when it has
+        # one (concurrent saves within the flush window share a single
+        # pipelined round trip), falling back to plain save otherwise —
+        # the same preference BaseAgent applies to its task writes.
+        self._save = getattr(self._task_repository, 'save_batched', None) or self._task_repository.save
+        self._repo_update_status = getattr(self._task_repository, 'update_status', None)
+        # Per-process LRU over repository lookups, keyed by task UUID.
+        # Every write through this service refreshes the entry and
+        # deletes evict it, so reads through the service stay coherent;
+        # cache operations never cross an await, so no lock is needed.
+        self._task_cache: "OrderedDict[UUID, Task]" = OrderedDict()
+
+    @property
+    def _info_enabled(self) -> bool:
+        """Whether INFO-level logs would be emitted, as in BaseAgent.
+
+        When INFO is filtered out, lifecycle methods skip building log
+        kwargs (and the id strings rendered inside them) entirely.
+        Re-checked per use so logging configured after this service was
+        constructed is honored.
+        """
+        return log_level_enabled(logging.INFO)
+
+    def _cache_task(self, task: Task) -> None:
+        """Insert or refresh a task in the LRU read cache."""
+        cache = self._task_cache
+        key = task.id.value
+        cache[key] = task
+        cache.move_to_end(key)
+        if len(cache) > self._TASK_CACHE_MAX:
+            cache.popitem(last=False)
+
+    def _evict_task(self, task_uuid: UUID) -> None:
+        """Drop a task from the read cache, if present."""
+        self._task_cache.pop(task_uuid, None)
 
     async def create_task(
         self,
@@ -39,13 +108,12 @@ class TaskService:
         """Create a new task."""
         try:
             # Validate agent exists
-            agent = await self._agent_manager.get_agent(agent_id)
-            if not agent:
+            if agent_id not in self._agents:
                 raise ValueError(f"Agent {agent_id} not found")
             
             # Create task
             task = Task(
-                agent_id=AgentId(UUID(agent_id)),
+                agent_id=AgentId(_parse_uuid(agent_id)),
                 name=name,
                 description=description,
                 priority=priority,
@@ -53,12 +121,14 @@ class TaskService:
             )
             
             # Save task
-            await self._task_repository.save(task)
-            
-            logger.info("Task created", 
-                       task_id=str(task.id), 
-                       agent_id=agent_id, 
-                       name=name)
+            await self._save(task)
+            self._cache_task(task)
+
+            if self._info_enabled:
+                logger.info("Task created",
+                           task_id=str(task.id),
+                           agent_id=agent_id,
+                           name=name)
             
             return task
             
@@ -66,11 +136,25 @@ class TaskService:
             logger.error("Error creating task", error=str(e), agent_id=agent_id, name=name)
             raise
 
+    async def _get_by_uuid(self, task_uuid: UUID) -> Optional[Task]:
+        """Fetch a task by parsed UUID, serving repeats from the read cache.
+
+        Internal mutate paths call this directly once they hold the
+        UUID, skipping get_task's re-parse and second error envelope.
+        """
+        cached = self._task_cache.get(task_uuid)
+        if cached is not None:
+            self._task_cache.move_to_end(task_uuid)
+            return cached
+        task = await self._task_repository.get_by_id(TaskId(task_uuid))
+        if task is not None:
+            self._cache_task(task)
+        return task
+
     async def get_task(self, task_id: str) -> Optional[Task]:
-        """Get task by ID."""
+        """Get task by ID, serving repeat lookups from the read cache."""
         try:
-            task_uuid = TaskId(UUID(task_id))
-            return await self._task_repository.get_by_id(task_uuid)
+            return await self._get_by_uuid(_parse_uuid(task_id))
         except Exception as e:
             logger.error("Error getting task", error=str(e), task_id=task_id)
             return None
@@ -85,7 +169,7 @@ class TaskService:
     ) -> Optional[Task]:
         """Update task."""
         try:
-            task = await self.get_task(task_id)
+            task = await self._get_by_uuid(_parse_uuid(task_id))
             if not task:
                 return None
             
@@ -99,12 +183,14 @@ class TaskService:
             if metadata is not None:
                 task.metadata.update(metadata)
             
-            task.updated_at = task.updated_at  # This would be set automatically in real implementation
-            
+            task.touch()
+
             # Save updated task
-            await self._task_repository.save(task)
-            
-            logger.info("Task updated", task_id=task_id)
+            await self._save(task)
+            self._cache_task(task)
+
+            if self._info_enabled:
+                logger.info("Task updated", task_id=task_id)
             return task
             
         except Exception as e:
@@ -114,11 +200,13 @@ class TaskService:
     async def delete_task(self, task_id: str) -> bool:
         """Delete task."""
         try:
-            task_uuid = TaskId(UUID(task_id))
-            success = await self._task_repository.delete(task_uuid)
-            
+            task_uuid = _parse_uuid(task_id)
+            success = await self._task_repository.delete(TaskId(task_uuid))
+
             if success:
-                logger.info("Task deleted", task_id=task_id)
+                self._evict_task(task_uuid)
+                if self._info_enabled:
+                    logger.info("Task deleted", task_id=task_id)
             
             return success
             
@@ -128,60 +216,98 @@ class TaskService:
 
     async def execute_task(self, task_id: str) -> Optional[Task]:
         """Execute task by assigning it to the appropriate agent."""
+        task: Optional[Task] = None
         try:
-            task = await self.get_task(task_id)
+            task = await self._get_by_uuid(_parse_uuid(task_id))
             if not task:
                 return None
             
             # Get agent
-            agent = await self._agent_manager.get_agent(str(task.agent_id))
+            agent = self._agents.get(task.agent_id_str)
             if not agent:
                 task.mark_failed("Agent not found")
-                await self._task_repository.save(task)
+                await self._save(task)
                 return task
             
             # Execute task
             executed_task = await agent.execute_task(task)
             
             # Save updated task
-            await self._task_repository.save(executed_task)
-            
-            logger.info("Task executed", 
-                       task_id=task_id, 
-                       status=executed_task.status.value)
+            await self._save(executed_task)
+            self._cache_task(executed_task)
+
+            if self._info_enabled:
+                logger.info("Task executed",
+                           task_id=task_id,
+                           status=executed_task.status.value)
             
             return executed_task
             
         except Exception as e:
             logger.error("Error executing task", error=str(e), task_id=task_id)
             
-            # Mark task as failed
-            task = await self.get_task(task_id)
+            # Mark the already-fetched task as failed; re-fetching is
+            # only needed if the failure happened inside the lookup.
+            if task is None:
+                task = await self.get_task(task_id)
             if task:
                 task.mark_failed(str(e))
-                await self._task_repository.save(task)
-            
+                await self._save(task)
+                self._cache_task(task)
+
             return task
 
+    async def execute_tasks(self, task_ids: List[str]) -> List[Optional[Task]]:
+        """Execute several tasks concurrently.
+
+        Independent tasks run on independent agents, so the batch
+        overlaps their I/O instead of serializing one await per task.
+        execute_task handles its own failures (a failing task comes back
+        marked failed, an unknown id as None), so no execution aborts
+        the rest of the batch.
+        """
+        return list(await asyncio.gather(
+            *(self.execute_task(task_id) for task_id in task_ids)
+        ))
+
     async def cancel_task(self, task_id: str) -> bool:
-        """Cancel task."""
+        """Cancel task.
+
+        Only pending or in-progress tasks can be cancelled.
+        """
         try:
-            task = await self.get_task(task_id)
+            task_uuid = _parse_uuid(task_id)
+
+            if self._repo_update_status:
+                # Targeted repository-side transition: the status guard
+                # and the write happen in one call, no fetch round trip.
+                cancelled = await self._repo_update_status(
+                    TaskId(task_uuid),
+                    TaskStatus.CANCELLED,
+                    allowed=(TaskStatus.PENDING, TaskStatus.IN_PROGRESS),
+                )
+                if cancelled:
+                    self._evict_task(task_uuid)
+                    if self._info_enabled:
+                        logger.info("Task cancelled", task_id=task_id)
+                return cancelled
+
+            task = await self._get_by_uuid(task_uuid)
             if not task:
                 return False
-            
-            # Can only cancel pending or in-progress tasks
-            if task.status not in [TaskStatus.PENDING, TaskStatus.IN_PROGRESS]:
+            if task.status not in (TaskStatus.PENDING, TaskStatus.IN_PROGRESS):
                 return False
-            
+
             task.status = TaskStatus.CANCELLED
-            task.updated_at = task.updated_at  # Would be set automatically
-            
-            await self._task_repository.save(task)
-            
-            logger.info("Task cancelled", task_id=task_id)
+            task.touch()
+
+            await self._save(task)
+            self._cache_task(task)
+
+            if self._info_enabled:
+                logger.info("Task cancelled", task_id=task_id)
             return True
-            
+
         except Exception as e:
             logger.error("Error cancelling task", error=str(e), task_id=task_id)
             return False
@@ -194,107 +320,72 @@ class TaskService:
     ) -> List[Task]:
         """List tasks with optional filtering."""
         try:
+            # The predicate and pagination are pushed down to the
+            # repository: indexed criteria resolve via the secondary
+            # indexes and only the requested page is materialized.
             if filters:
-                # Use repository's find_by_criteria if available
-                if hasattr(self._task_repository, 'find_by_criteria'):
-                    tasks = await self._task_repository.find_by_criteria(filters)
-                else:
-                    # Fallback: get all and filter manually
-                    all_tasks = await self._task_repository.list_all()
-                    tasks = []
-                    for task in all_tasks:
-                        match = True
-                        for key, value in filters.items():
-                            task_value = getattr(task, key, None)
-                            if task_value != value:
-                                # Handle special cases
-                                if key == "agent_id" and str(task_value) != value:
-                                    match = False
-                                    break
-                                elif key == "status" and (
-                                    hasattr(task_value, 'value') and task_value.value != value
-                                ):
-                                    match = False
-                                    break
-                                elif key == "priority" and (
-                                    hasattr(task_value, 'name') and task_value.name.lower() != value.lower()
-                                ):
-                                    match = False
-                                    break
-                        if match:
-                            tasks.append(task)
+                tasks = await self._task_repository.find_by_criteria(
+                    filters, offset=offset, limit=limit
+                )
             else:
-                tasks = await self._task_repository.list_all()
-            
-            # Apply pagination
-            end_index = min(offset + limit, len(tasks))
-            paginated_tasks = tasks[offset:end_index]
-            
-            return paginated_tasks
+                tasks = await self._task_repository.list_all(offset=offset, limit=limit)
+
+            return tasks
             
         except Exception as e:
             logger.error("Error listing tasks", error=str(e), filters=filters)
             return []
 
+    # The single-criterion helpers below go straight to the repository:
+    # a one-key criteria query is exactly one index-set read (SINTER
+    # degenerates to SMEMBERS on Redis), and skipping list_tasks also
+    # skips its default pagination cap, which "get all" callers such as
+    # the execution monitor should not be silently subject to.
+
     async def get_tasks_by_agent(self, agent_id: str) -> List[Task]:
         """Get all tasks for a specific agent."""
-        return await self.list_tasks({"agent_id": agent_id})
+        return await self._task_repository.find_by_criteria({"agent_id": agent_id})
 
     async def get_pending_tasks(self) -> List[Task]:
         """Get all pending tasks."""
-        return await self.list_tasks({"status": TaskStatus.PENDING.value})
+        return await self._task_repository.find_by_criteria({"status": TaskStatus.PENDING.value})
 
     async def get_active_tasks(self) -> List[Task]:
         """Get all active (in-progress) tasks."""
-        return await self.list_tasks({"status": TaskStatus.IN_PROGRESS.value})
+        return await self._task_repository.find_by_criteria({"status": TaskStatus.IN_PROGRESS.value})
 
     async def get_completed_tasks(self) -> List[Task]:
         """Get all completed tasks."""
-        return await self.list_tasks({"status": TaskStatus.COMPLETED.value})
+        return await self._task_repository.find_by_criteria({"status": TaskStatus.COMPLETED.value})
 
     async def get_task_statistics(self) -> Dict[str, Any]:
         """Get comprehensive task statistics."""
         try:
-            all_tasks = await self._task_repository.list_all()
-            
-            stats = {
-                "total": len(all_tasks),
-                "by_status": {},
-                "by_priority": {},
-                "by_agent": {},
-                "completion_rate": 0.0,
-                "failure_rate": 0.0,
-            }
-            
-            completed_count = 0
-            failed_count = 0
-            
-            for task in all_tasks:
-                # Status statistics
-                status = task.status.value if hasattr(task.status, 'value') else str(task.status)
-                stats["by_status"][status] = stats["by_status"].get(status, 0) + 1
-                
-                # Priority statistics
-                priority = task.priority.name if hasattr(task.priority, 'name') else str(task.priority)
-                stats["by_priority"][priority] = stats["by_priority"].get(priority, 0) + 1
-                
-                # Agent statistics
-                agent_id = str(task.agent_id)
-                stats["by_agent"][agent_id] = stats["by_agent"].get(agent_id, 0) + 1
-                
-                # Count completed and failed
-                if task.status == TaskStatus.COMPLETED:
-                    completed_count += 1
-                elif task.status == TaskStatus.FAILED:
-                    failed_count += 1
-            
-            # Calculate rates
-            if len(all_tasks) > 0:
-                stats["completion_rate"] = completed_count / len(all_tasks)
-                stats["failure_rate"] = failed_count / len(all_tasks)
-            
+            if self._repo_stats_snapshot:
+                # Counts come straight off the repository's indexes; no
+                # iteration over tasks at all.
+                snapshot = await self._repo_stats_snapshot()
+                total = snapshot["total"]
+                by_status = snapshot["by_status"]
+            else:
+                all_tasks = await self._task_repository.list_all()
+                total = len(all_tasks)
+                by_status = Counter(task.status.value for task in all_tasks)
+                snapshot = {
+                    "total": total,
+                    "by_status": dict(by_status),
+                    "by_priority": dict(Counter(task.priority.name for task in all_tasks)),
+                    "by_agent": dict(Counter(task.agent_id_str for task in all_tasks)),
+                }
+
+            stats = dict(snapshot)
+            completed_count = by_status.get(TaskStatus.COMPLETED.value, 0)
+            failed_count = by_status.get(TaskStatus.FAILED.value, 0)
+            stats["completion_rate"] = completed_count / total if total else 0.0
+            stats["failure_rate"] = failed_count / total if total else 0.0
+
             return stats
-            
+
         except Exception as e:
             logger.error("Error getting task statistics", error=str(e))
             return {
@@ -309,22 +400,23 @@ class TaskService:
     async def assign_task_to_agent(self, task_id: str, agent_id: str) -> bool:
         """Assign existing task to a different agent."""
         try:
-            task = await self.get_task(task_id)
+            task = await self._get_by_uuid(_parse_uuid(task_id))
             if not task:
                 return False
             
             # Validate new agent exists
-            agent = await self._agent_manager.get_agent(agent_id)
-            if not agent:
+            if agent_id not in self._agents:
                 return False
             
             # Update task assignment
-            task.agent_id = AgentId(UUID(agent_id))
-            task.updated_at = task.updated_at  # Would be set automatically
+            task.agent_id = AgentId(_parse_uuid(agent_id))
+            task.touch()
             
-            await self._task_repository.save(task)
-            
-            logger.info("Task reassigned", task_id=task_id, new_agent_id=agent_id)
+            await self._save(task)
+            self._cache_task(task)
+
+            if self._info_enabled:
+                logger.info("Task reassigned", task_id=task_id, new_agent_id=agent_id)
             return True
             
         except Exception as e:
@@ -338,31 +430,45 @@ class TaskService:
     ) -> List[Task]:
         """Create tasks for a specific research phase."""
         try:
-            tasks = []
-            
-            # Get Prometheus agent to coordinate task creation
+            tasks: List[Task] = []
+
+            # Get Prometheus agent to coordinate task creation. The old
+            # guard was inverted (`not prometheus_agent and hasattr(...)`)
+            # and made this block unreachable.
             prometheus_agent = await self._agent_manager.get_prometheus_agent()
-            if not prometheus_agent and hasattr(prometheus_agent, 'decompose_research_phase'):
+            if prometheus_agent and hasattr(prometheus_agent, 'decompose_research_phase'):
                 phase_tasks = await prometheus_agent.decompose_research_phase(phase)
-                
+
+                # Resolve every target agent type up front, then build
+                # the batch and persist it in one repository call rather
+                # than one lookup and one write per task.
+                target_types = {
+                    agent_type
+                    for task_def in phase_tasks
+                    if (agent_type := task_def.metadata.get("target_agent"))
+                }
+                agents_by_type = await self._agent_manager.get_agents_by_types(target_types)
+
                 for task_def in phase_tasks:
-                    target_agent_type = task_def.metadata.get("target_agent")
-                    target_agent = await self._agent_manager.get_agent_by_type(target_agent_type)
-                    
+                    target_agent = agents_by_type.get(task_def.metadata.get("target_agent"))
                     if target_agent:
-                        task = await self.create_task(
-                            agent_id=str(target_agent.id),
+                        tasks.append(Task(
+                            agent_id=target_agent.id,
                             name=task_def.name,
                             description=task_def.description,
                             priority=task_def.priority,
-                            metadata=task_def.metadata
-                        )
-                        tasks.append(task)
-            
-            logger.info("Research phase tasks created", 
-                       phase=phase, 
+                            metadata=task_def.metadata,
+                        ))
+
+                if tasks:
+                    await self._task_repository.save_many(tasks)
+                    for task in tasks:
+                        self._cache_task(task)
+
+            logger.info("Research phase tasks created",
+                       phase=phase,
                        tasks_created=len(tasks))
-            
+
             return tasks
             
         except Exception as e:
@@ -374,41 +480,43 @@ class TaskService:
         try:
             active_tasks = await self.get_active_tasks()
             
+            agent_workload: Counter = Counter()
+            task_details: List[Dict[str, Any]] = []
+            stuck_tasks: List[Dict[str, Any]] = []
             monitoring_data = {
                 "active_tasks": len(active_tasks),
-                "task_details": [],
-                "agent_workload": {},
-                "stuck_tasks": [],
+                "task_details": task_details,
+                "agent_workload": agent_workload,
+                "stuck_tasks": stuck_tasks,
                 "estimated_completion": {},
             }
-            
+
+            # One clock reading and one derived cutoff for the whole
+            # pass; everything else is a single walk over the (already
+            # index-filtered) active tasks.
+            now = datetime.utcnow()
+            stuck_cutoff = now - _STUCK_TASK_THRESHOLD
+
             for task in active_tasks:
-                agent_id = str(task.agent_id)
-                
-                # Count tasks per agent
-                monitoring_data["agent_workload"][agent_id] = (
-                    monitoring_data["agent_workload"].get(agent_id, 0) + 1
-                )
-                
-                # Task details
-                task_detail = {
+                agent_id = task.agent_id_str
+                agent_workload[agent_id] += 1
+
+                task_details.append({
                     "id": str(task.id),
                     "name": task.name,
                     "agent_id": agent_id,
-                    "started_at": task.updated_at.isoformat(),
-                    "priority": task.priority.name if hasattr(task.priority, 'name') else str(task.priority),
-                }
-                monitoring_data["task_details"].append(task_detail)
-                
-                # Check for stuck tasks (simplified logic)
-                from datetime import datetime, timedelta
-                if task.updated_at < datetime.utcnow() - timedelta(hours=1):
-                    monitoring_data["stuck_tasks"].append({
+                    "started_at": task.updated_iso,
+                    "priority": task.priority.name,
+                })
+
+                if task.updated_at < stuck_cutoff:
+                    stuck_tasks.append({
                         "id": str(task.id),
                         "name": task.name,
-                        "stuck_duration_hours": (datetime.utcnow() - task.updated_at).total_seconds() / 3600,
+                        "stuck_duration_hours": (now - task.updated_at).total_seconds() / 3600,
                     })
-            
+
+            monitoring_data["agent_workload"] = dict(agent_workload)
             return monitoring_data
             
         except Exception as e:
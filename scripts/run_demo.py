@@ -123,12 +123,14 @@ async def run_demo():
         
         # Execute tasks
         print("\n⚡ Executing tasks...")
-        executed_tasks = []
-        
-        for i, task in enumerate(demo_tasks[:2]):  # Execute first 2 tasks for demo
+        batch = demo_tasks[:2]  # Execute first 2 tasks for demo
+
+        for i, task in enumerate(batch):
             print(f"   Executing task {i+1}: {task.name}")
-            executed_task = await task_service.execute_task(str(task.id))
-            executed_tasks.append(executed_task)
+        # The tasks run on different agents, so execute them as one
+        # concurrent batch instead of awaiting each in turn.
+        executed_tasks = await task_service.execute_tasks([str(task.id) for task in batch])
+        for executed_task in executed_tasks:
             print(f"   ✅ Task completed with status: {executed_task.status.value}")
         
         # Demonstrate inter-agent communication